@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,8 +18,8 @@ from app.core.security import (
     create_access_token,
     create_password_reset_token,
     create_verification_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     verify_token,
 )
 from app.models.user import (
@@ -50,6 +50,7 @@ logger = get_logger(__name__)
 async def register(
     request: Request,
     data: UserCreate,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
 ) -> User:
     """Register a new user account.
@@ -71,15 +72,18 @@ async def register(
 
     user = User(
         email=data.email,
-        hashed_password=hash_password(data.password),
+        hashed_password=await hash_password_async(data.password),
     )
     session.add(user)
     await session.commit()
     await session.refresh(user)
 
-    # Send verification email
+    # Send verification email after the response so the Resend call
+    # never holds the request open
     verification_token = create_verification_token(user.id)
-    await send_verification_email(str(user.email), verification_token)
+    background_tasks.add_task(
+        send_verification_email, str(user.email), verification_token
+    )
 
     logger.info(
         "user_registered",
@@ -107,7 +111,9 @@ async def login(
     result = await session.execute(statement)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -134,6 +140,7 @@ async def login(
 @router.post("/verify-email", response_model=UserRead)
 async def verify_email(
     data: EmailVerification,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
 ) -> User:
     """Verify user's email address using token from email link."""
@@ -163,7 +170,7 @@ async def verify_email(
     await session.commit()
     await session.refresh(user)
 
-    await send_welcome_email(str(user.email))
+    background_tasks.add_task(send_welcome_email, str(user.email))
 
     logger.info(
         "email_verified",
@@ -178,6 +185,7 @@ async def verify_email(
 async def forgot_password(
     request: Request,
     data: ForgotPassword,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
 ) -> dict[str, str]:
     """Request password reset email.
@@ -192,7 +200,9 @@ async def forgot_password(
 
     if user and user.is_active:
         reset_token = create_password_reset_token(user.id)
-        await send_password_reset_email(str(user.email), reset_token)
+        background_tasks.add_task(
+            send_password_reset_email, str(user.email), reset_token
+        )
 
         logger.info(
             "password_reset_requested",
@@ -235,7 +245,7 @@ async def reset_password(
             detail="User account is disabled",
         )
 
-    user.hashed_password = hash_password(data.new_password)
+    user.hashed_password = await hash_password_async(data.new_password)
     user.updated_at = datetime.now(UTC)
     session.add(user)
     await session.commit()
@@ -262,6 +272,7 @@ async def get_current_user_profile(
 async def resend_verification(
     request: Request,
     email: EmailStr,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
 ) -> dict[str, str]:
     """Resend verification email.
@@ -277,7 +288,9 @@ async def resend_verification(
 
     if user and not user.is_verified and user.is_active:
         verification_token = create_verification_token(user.id)
-        await send_verification_email(str(user.email), verification_token)
+        background_tasks.add_task(
+            send_verification_email, str(user.email), verification_token
+        )
 
         logger.info(
             "verification_resent",
@@ -341,7 +354,12 @@ async def delete_current_user_account(
 
     user_id = current_user.id
 
-    sessions_stmt = select(Session).where(Session.patient_id == user_id)
+    # Load cascaded exercise results in one batch instead of one query per session
+    sessions_stmt = (
+        select(Session)
+        .where(Session.patient_id == user_id)
+        .options(selectinload(Session.exercise_results))  # type: ignore[arg-type]
+    )
     sessions_result = await session.execute(sessions_stmt)
     for sess in sessions_result.scalars().all():
         await session.delete(sess)
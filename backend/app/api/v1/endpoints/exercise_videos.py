@@ -8,11 +8,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.core.database import get_session
 from app.core.deps import ActiveUser
+from app.core.listing import read_columns, rows_response
 from app.core.logging import get_logger
 from app.models.exercise import Exercise
 from app.models.exercise_video import (
@@ -28,6 +30,8 @@ logger = get_logger(__name__)
 _VIDEO_NOT_FOUND = "Video not found"
 _EXERCISE_NOT_FOUND = "Exercise not found"
 
+_VIDEO_READ_COLUMNS = read_columns(ExerciseVideo, ExerciseVideoRead)
+
 
 @router.get("/exercise/{exercise_id}", response_model=list[ExerciseVideoRead])
 async def list_exercise_videos(
@@ -36,10 +40,10 @@ async def list_exercise_videos(
     current_user: ActiveUser,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=50),
-) -> list[ExerciseVideo]:
+) -> ORJSONResponse:
     """List all active demo videos for a specific exercise."""
     statement = (
-        select(ExerciseVideo)
+        select(*_VIDEO_READ_COLUMNS)
         .where(ExerciseVideo.exercise_id == exercise_id)
         .where(ExerciseVideo.is_active == True)  # noqa: E712
         .order_by(
@@ -49,8 +53,7 @@ async def list_exercise_videos(
         .offset(skip)
         .limit(limit)
     )
-    result = await session.execute(statement)
-    return list(result.scalars().all())
+    return await rows_response(session, statement)
 
 
 @router.get("/exercise/{exercise_id}/primary", response_model=ExerciseVideoRead | None)
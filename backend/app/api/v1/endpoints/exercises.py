@@ -5,11 +5,14 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.core.database import get_session
 from app.core.deps import ActiveUser, AdminUser
+from app.core.listing import read_columns, rows_response
 from app.core.logging import get_logger
 from app.models.exercise import (
     BodyPart,
@@ -25,6 +28,8 @@ logger = get_logger(__name__)
 
 _EXERCISE_NOT_FOUND = "Exercise not found"
 
+_EXERCISE_READ_COLUMNS = read_columns(Exercise, ExerciseRead)
+
 
 @router.get("", response_model=list[ExerciseRead])
 async def list_exercises(
@@ -35,9 +40,9 @@ async def list_exercises(
     difficulty: int | None = Query(None, ge=1, le=5),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-) -> list[Exercise]:
+) -> ORJSONResponse:
     """List all active exercises with optional filters."""
-    statement = select(Exercise).where(Exercise.is_active == True)  # noqa: E712
+    statement = select(*_EXERCISE_READ_COLUMNS).where(Exercise.is_active == true())
 
     if category:
         statement = statement.where(Exercise.category == category)
@@ -47,8 +52,7 @@ async def list_exercises(
         statement = statement.where(Exercise.difficulty_level == difficulty)
 
     statement = statement.offset(skip).limit(limit).order_by(Exercise.name)
-    result = await session.execute(statement)
-    return list(result.scalars().all())
+    return await rows_response(session, statement)
 
 
 @router.get("/{exercise_id}", response_model=ExerciseRead)
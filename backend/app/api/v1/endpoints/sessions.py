@@ -5,13 +5,17 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from app.core.database import get_session
 from app.core.deps import ActiveUser
+from app.core.listing import read_columns, rows_response
 from app.core.logging import get_logger
+from app.models.exercise import Exercise
 from app.models.session import (
     Session,
     SessionComplete,
@@ -32,6 +36,9 @@ logger = get_logger(__name__)
 SESSION_NOT_FOUND = "Session not found"
 ACCESS_DENIED = "Access denied"
 
+# SessionRead has no device_info, so list queries never load the JSON column
+_SESSION_READ_COLUMNS = read_columns(Session, SessionRead)
+
 
 @router.get("", response_model=list[SessionRead])
 async def list_sessions(
@@ -40,9 +47,11 @@ async def list_sessions(
     status_filter: SessionStatus | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-) -> list[Session]:
+) -> ORJSONResponse:
     """List sessions for the current user."""
-    statement = select(Session).where(Session.patient_id == current_user.id)
+    statement = select(*_SESSION_READ_COLUMNS).where(
+        Session.patient_id == current_user.id
+    )
 
     if status_filter:
         statement = statement.where(Session.status == status_filter)
@@ -52,8 +61,7 @@ async def list_sessions(
         .offset(skip)
         .limit(limit)
     )
-    result = await session.execute(statement)
-    return list(result.scalars().all())
+    return await rows_response(session, statement)
 
 
 @router.get("/{session_id}", response_model=SessionReadWithResults)
@@ -188,16 +196,13 @@ async def complete_session(
         duration = completed - started
         exercise_session.duration_seconds = int(duration.total_seconds())
 
-    statement = select(SessionExerciseResult).where(
+    # Aggregate in SQL rather than loading every result row; AVG skips NULLs
+    statement = select(func.avg(SessionExerciseResult.score)).where(
         SessionExerciseResult.session_id == session_id
     )
-    result = await session.execute(statement)
-    results = result.scalars().all()
-
-    if results:
-        scores = [r.score for r in results if r.score is not None]
-        if scores:
-            exercise_session.overall_score = sum(scores) / len(scores)
+    average_score = (await session.execute(statement)).scalar_one()
+    if average_score is not None:
+        exercise_session.overall_score = float(average_score)
 
     session.add(exercise_session)
     await session.commit()
@@ -255,7 +260,19 @@ async def submit_exercise_result(
     current_user: ActiveUser,
 ) -> SessionExerciseResult:
     """Submit results for an exercise within a session."""
-    exercise_session = await session.get(Session, session_id)
+    # Fetch session and exercise in one round-trip on the success path
+    row = (
+        await session.execute(
+            select(Session, Exercise)
+            .join(Exercise, Exercise.id == data.exercise_id)
+            .where(Session.id == session_id)
+        )
+    ).first()
+    if row is not None:
+        exercise_session, exercise = row
+    else:
+        exercise_session, exercise = await session.get(Session, session_id), None
+
     if not exercise_session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -274,9 +291,6 @@ async def submit_exercise_result(
             detail="Cannot submit results to a completed session",
         )
 
-    from app.models.exercise import Exercise
-
-    exercise = await session.get(Exercise, data.exercise_id)
     if not exercise:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
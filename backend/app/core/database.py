@@ -4,25 +4,66 @@ Uses connection pooling for Postgres, simple connections for SQLite.
 """
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import SQLModel
 
 from app.core.config import settings
 
 # Engine configuration varies by database type
-_connect_args = {"check_same_thread": False} if settings.is_sqlite else {}
+_engine_kwargs: dict[str, Any]
+if settings.is_sqlite:
+    _engine_kwargs = {"connect_args": {"check_same_thread": False}}
+else:
+    # Explicit pool sizing; pre-ping and recycle drop stale connections after
+    # DB restarts or idle timeouts instead of failing the next request.
+    _engine_kwargs = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "connect_args": {
+            "server_settings": {
+                "statement_timeout": str(settings.db_statement_timeout_ms),
+            },
+        },
+    }
 
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    connect_args=_connect_args,
+    **_engine_kwargs,
+)
+
+# SQLite connections are pooled by SQLAlchemy; tune each one as it is opened
+# so the page cache stays hot and writers don't block readers (dev/test path).
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
 )
 
-async_session_factory = sessionmaker(  # type: ignore[call-overload]
+if settings.is_sqlite:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+async_session_factory = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,
 )
 
@@ -4,6 +4,7 @@ Sanitizes error messages to prevent information leakage in production.
 Exposes detailed errors only in debug mode.
 """
 
+import secrets
 from typing import Any
 
 from fastapi import HTTPException, Request, status
@@ -49,6 +50,19 @@ class InternalServerError(HTTPException):
         )
 
 
+def new_request_id(request: Request) -> str:
+    """Return the client-supplied X-Request-ID or a fresh random one."""
+    return request.headers.get("X-Request-ID") or secrets.token_hex(8)
+
+
+def get_request_id(request: Request) -> str:
+    """Return the request ID assigned by middleware for log correlation."""
+    request_id = getattr(request.state, "request_id", None)
+    if isinstance(request_id, str):
+        return request_id
+    return new_request_id(request)
+
+
 def sanitize_error_message(error: Exception) -> str:
     """Sanitize error message for production.
 
@@ -117,8 +131,7 @@ async def global_exception_handler(
     Catches all exceptions not handled by specific handlers,
     logs them, and returns sanitized error response.
     """
-    # Generate request ID for tracking
-    request_id = request.headers.get("X-Request-ID", str(id(request)))
+    request_id = get_request_id(request)
 
     # Log the full error
     logger.error(
@@ -163,7 +176,7 @@ async def http_exception_handler(
     For 500 errors, sanitizes the message in production.
     For other errors, preserves the original message.
     """
-    request_id = request.headers.get("X-Request-ID", str(id(request)))
+    request_id = get_request_id(request)
 
     # For 5xx errors, sanitize in production
     if exc.status_code >= 500 and not settings.debug:
@@ -0,0 +1,21 @@
+"""Shared identifier helpers."""
+
+import os
+import time
+from uuid import UUID
+
+_VERSION_MASK = ~(0xF << 76)
+_VARIANT_MASK = ~(0x3 << 62)
+_VERSION_7 = 0x7 << 76
+_VARIANT_RFC = 0x2 << 62
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land on the rightmost B-tree leaf instead of a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    return UUID(int=value & _VERSION_MASK & _VARIANT_MASK | _VERSION_7 | _VARIANT_RFC)
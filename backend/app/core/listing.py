@@ -0,0 +1,32 @@
+"""Column-only list queries encoded straight to JSON.
+
+List endpoints select just their read schema's columns and encode the rows
+with orjson, skipping ORM entity loading and per-row pydantic validation.
+FastAPI does not check a returned Response against ``response_model``, so
+the column tuple from ``read_columns`` is what keeps the JSON in the
+documented schema's shape.
+"""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+
+def read_columns(
+    table_model: type[SQLModel], read_schema: type[SQLModel]
+) -> tuple[Any, ...]:
+    """Return the table columns named by the read schema's fields, in order.
+
+    Raises AttributeError at import time if the schema names a field the
+    table does not have.
+    """
+    return tuple(getattr(table_model, name) for name in read_schema.model_fields)
+
+
+async def rows_response(session: AsyncSession, statement: Select) -> ORJSONResponse:
+    """Execute a ``read_columns`` select and return its rows as a JSON array."""
+    result = await session.execute(statement)
+    return ORJSONResponse([dict(row) for row in result.mappings()])
@@ -1,11 +1,28 @@
 """Structured JSON logging configuration for CloudWatch compatibility."""
 
+import json
 import logging
 import sys
+from typing import Any
 
+import orjson
 import structlog
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, returning str for stdlib handlers.
+
+    orjson rejects integers beyond 64 bits; such events go through stdlib json.
+    """
+    default = kwargs.get("default")
+    try:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    except TypeError:
+        return json.dumps(obj, default=default)
+
+
 def setup_logging(*, json_logs: bool = True, log_level: str = "INFO") -> None:
     """Configure structlog for structured JSON output.
 
@@ -22,7 +39,9 @@ def setup_logging(*, json_logs: bool = True, log_level: str = "INFO") -> None:
     ]
 
     if json_logs:
-        shared_processors.append(structlog.processors.JSONRenderer())
+        shared_processors.append(
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        )
     else:
         shared_processors.append(structlog.dev.ConsoleRenderer())
 
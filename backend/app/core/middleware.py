@@ -0,0 +1,102 @@
+"""Pure ASGI middleware for security headers, request IDs and rate limiting.
+
+Implemented as plain ASGI callables instead of ``@app.middleware("http")``
+to avoid BaseHTTPMiddleware's per-request task group and response wrapping.
+"""
+
+from fastapi import HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.exceptions import new_request_id
+from app.core.rate_limit import api_limiter
+
+_HEALTH_PATH = "/health"
+
+# Security Headers (HTTPS Enforcement & Hardening), encoded once at import
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    # HSTS: Tell browser to only use HTTPS for next 2 years
+    (b"strict-transport-security", b"max-age=63072000; includeSubDomains; preload"),
+    # Prevent MIME type sniffing
+    (b"x-content-type-options", b"nosniff"),
+    # Prevent clickjacking
+    (b"x-frame-options", b"DENY"),
+    # Enable XSS protection in older browsers
+    (b"x-xss-protection", b"1; mode=block"),
+    # Control referrer information
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+)
+# Names this middleware sets; existing values are replaced, not duplicated
+_MANAGED_HEADER_NAMES = frozenset(
+    {name for name, _ in _SECURITY_HEADERS} | {b"x-request-id"}
+)
+
+
+class SecurityHeadersMiddleware:
+    """Add security headers and a request ID, and enforce the global rate limit."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Read once when Starlette builds the middleware stack, not per request
+        self.rate_limit_enabled = settings.rate_limit_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Assign the request ID once; exception handlers read it from request.state
+        request = Request(scope)
+        request_id = new_request_id(request)
+        request.state.request_id = request_id
+        request_id_header = request_id.encode("latin-1")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    header
+                    for header in message.get("headers", ())
+                    if header[0].lower() not in _MANAGED_HEADER_NAMES
+                ]
+                headers.extend(_SECURITY_HEADERS)
+                headers.append((b"x-request-id", request_id_header))
+                message["headers"] = headers
+            await send(message)
+
+        # Global Rate Limiting (skip for health checks)
+        if self.rate_limit_enabled and scope["path"] != _HEALTH_PATH:
+            try:
+                await api_limiter.check(request, "global")
+            except HTTPException as exc:
+                response = JSONResponse(
+                    status_code=exc.status_code,
+                    content={"detail": exc.detail},
+                    headers=exc.headers,
+                )
+                await response(scope, receive, send_wrapper)
+                return
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that lets tiny fixed responses (e.g. /health) bypass it."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        exclude_paths: frozenset[str] = frozenset(),
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -4,10 +4,11 @@ Provides decorator-based rate limiting for FastAPI endpoints.
 Falls back to in-memory limiter when Redis is unavailable.
 """
 
-import asyncio
+from collections import OrderedDict, deque
 from collections.abc import Callable
-from datetime import datetime
 from functools import wraps
+from time import monotonic
+from time import time as _time
 from typing import Any
 
 from fastapi import HTTPException, Request, status
@@ -17,8 +18,81 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-# In-memory fallback storage (for dev/testing without Redis)
-_memory_store: dict[str, list[float]] = {}
+# In-memory fallback storage (for dev/testing without Redis).
+# Bounded LRU of per-key request timestamps, oldest first in each deque.
+_MEMORY_STORE_MAX_KEYS = 100_000
+_memory_store: OrderedDict[str, deque[float]] = OrderedDict()
+
+# Redis client shared by every RateLimiter so they use one connection pool.
+_redis_client: Any = None
+_REDIS_MAX_CONNECTIONS = 50
+# After a failed connect, skip Redis until this monotonic time
+_REDIS_RETRY_SECONDS = 30.0
+_redis_retry_at = 0.0
+
+# Atomic sliding-window check: prune, count, and record only when under limit.
+# KEYS[1] = bucket key; ARGV = window_start, now, limit, window_seconds.
+# Returns {allowed, remaining}.
+_SLIDING_WINDOW_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local count = redis.call('ZCARD', KEYS[1])
+local limit = tonumber(ARGV[3])
+if count >= limit then
+    return {0, 0}
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return {1, limit - count - 1}
+"""
+
+
+async def get_redis_client() -> Any:
+    """Lazily connect the shared Redis client (None if unavailable).
+
+    Only one connect attempt runs at a time and nobody waits on it: other
+    callers get None (memory fallback) until it succeeds. After a failure,
+    connects are not retried for ``_REDIS_RETRY_SECONDS``.
+    """
+    global _redis_client, _redis_retry_at
+    if _redis_client is not None:
+        return _redis_client
+    now = monotonic()
+    if now < _redis_retry_at:
+        return None
+
+    # Claim the attempt before the first await; no lock needed on one loop
+    _redis_retry_at = now + _REDIS_RETRY_SECONDS
+    try:
+        import redis.asyncio as redis  # type: ignore
+
+        client = redis.from_url(
+            settings.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=_REDIS_MAX_CONNECTIONS,
+        )
+        # Test connection
+        await client.ping()
+    except Exception as e:
+        logger.warning(
+            "rate_limiter_redis_unavailable",
+            error=str(e),
+            retry_in_seconds=_REDIS_RETRY_SECONDS,
+        )
+        return None
+
+    _redis_client = client
+    logger.info("rate_limiter_redis_connected")
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client. Called on application shutdown."""
+    global _redis_client, _redis_retry_at
+    _redis_retry_at = 0.0
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
 
 
 class RateLimiter:
@@ -41,35 +115,26 @@ class RateLimiter:
         self.requests = requests
         self.window_seconds = window_seconds
         self.use_redis = use_redis and settings.rate_limit_enabled
-        self._redis_client: Any = None
+        self._window_script: Any = None
 
     async def _get_redis(self) -> Any:
-        """Lazy load Redis client."""
-        if self._redis_client is None and self.use_redis:
-            try:
-                import redis.asyncio as redis  # type: ignore
-
-                self._redis_client = redis.from_url(
-                    settings.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True,
-                )
-                # Test connection
-                await self._redis_client.ping()
-                logger.info("rate_limiter_redis_connected")
-            except Exception as e:
-                logger.warning("rate_limiter_redis_unavailable", error=str(e))
-                self._redis_client = None
-        return self._redis_client
+        """Return the shared Redis client, or None if Redis is not in use."""
+        if not self.use_redis:
+            return None
+        return await get_redis_client()
 
     def _get_client_key(self, request: Request, key_prefix: str) -> str:
         """Generate unique key for client identification."""
-        # Use X-Forwarded-For header for clients behind proxy, fallback to client IP
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            client_ip = forwarded.split(",")[0].strip()
-        else:
-            client_ip = request.client.host if request.client else "unknown"
+        # Resolved once per request; stacked limiters reuse the cached value
+        client_ip = getattr(request.state, "client_ip", None)
+        if not isinstance(client_ip, str):
+            # Use X-Forwarded-For header for clients behind proxy, fallback to client IP
+            forwarded = request.headers.get("X-Forwarded-For")
+            if forwarded:
+                client_ip = forwarded.split(",", 1)[0].strip()
+            else:
+                client_ip = request.client.host if request.client else "unknown"
+            request.state.client_ip = client_ip
 
         return f"rate_limit:{key_prefix}:{client_ip}"
 
@@ -80,54 +145,55 @@ class RateLimiter:
             return await self._check_memory(key)
 
         try:
-            now = datetime.now().timestamp()
+            # Wall-clock time so entries stay meaningful across restarts
+            now = _time()
             window_start = now - self.window_seconds
 
-            # Use Redis sorted set for sliding window
-            pipe = redis_client.pipeline()
-            pipe.zremrangebyscore(key, 0, window_start)
-            pipe.zadd(key, {str(now): now})
-            pipe.zcard(key)
-            pipe.expire(key, self.window_seconds)
-            results = await pipe.execute()
-
-            current_requests = results[2]
-            remaining = max(0, self.requests - current_requests)
-
-            if current_requests > self.requests:
-                # Remove the request we just added since it's over limit
-                await redis_client.zrem(key, str(now))
-                return False, 0
+            # Sliding window on a sorted set, evaluated in a single round trip.
+            # register_script uses EVALSHA and reloads the script on NOSCRIPT.
+            # The script stays bound to the client it was registered on, so
+            # pass the current one to survive close_redis_client()/reconnect.
+            if self._window_script is None:
+                self._window_script = redis_client.register_script(_SLIDING_WINDOW_LUA)
+            allowed, remaining = await self._window_script(
+                keys=[key],
+                args=[window_start, now, self.requests, self.window_seconds],
+                client=redis_client,
+            )
 
-            return True, remaining
+            return bool(allowed), int(remaining)
         except Exception as e:
             logger.warning("rate_limit_redis_error", error=str(e))
             return await self._check_memory(key)
 
     def _check_memory_sync(self, key: str) -> tuple[bool, int]:
         """Fallback in-memory rate limiting (synchronous)."""
-        now = datetime.now().timestamp()
+        now = monotonic()
         window_start = now - self.window_seconds
 
-        if key not in _memory_store:
-            _memory_store[key] = []
+        timestamps = _memory_store.get(key)
+        if timestamps is None:
+            timestamps = _memory_store[key] = deque()
+            if len(_memory_store) > _MEMORY_STORE_MAX_KEYS:
+                _memory_store.popitem(last=False)
+        else:
+            _memory_store.move_to_end(key)
 
         # Clean old entries
-        _memory_store[key] = [t for t in _memory_store[key] if t > window_start]
+        while timestamps and timestamps[0] <= window_start:
+            timestamps.popleft()
 
-        current_requests = len(_memory_store[key])
+        current_requests = len(timestamps)
         remaining = max(0, self.requests - current_requests)
 
         if current_requests >= self.requests:
             return False, 0
 
-        _memory_store[key].append(now)
+        timestamps.append(now)
         return True, remaining - 1
 
     async def _check_memory(self, key: str) -> tuple[bool, int]:
         """Async wrapper for in-memory rate limiting."""
-        # Simulate async I/O
-        await asyncio.sleep(0)
         return self._check_memory_sync(key)
 
     async def check(self, request: Request, key_prefix: str = "default") -> None:
@@ -6,6 +6,7 @@ by removing or escaping potentially dangerous HTML/JavaScript content.
 
 import html
 import re
+from functools import lru_cache
 from typing import Annotated, Any
 
 from pydantic import AfterValidator
@@ -22,26 +23,67 @@ XSS_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"javascript\s*:", re.IGNORECASE),
     re.compile(r"vbscript\s*:", re.IGNORECASE),
     re.compile(r"data\s*:", re.IGNORECASE),
-    # HTML tags that can execute scripts
-    re.compile(r"<\s*img[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*svg[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*iframe[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*object[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*embed[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*link[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*style[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*meta[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*base[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*form[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*input[^>]*>", re.IGNORECASE),
-    re.compile(r"<\s*button[^>]*>", re.IGNORECASE),
     # Expression injection
     re.compile(r"expression\s*\(", re.IGNORECASE),
     re.compile(r"eval\s*\(", re.IGNORECASE),
-    # Generic HTML tags
+    # Generic HTML tags (also covers img/svg/iframe/object/embed/link/style/...)
     re.compile(r"<[^>]+>"),
 ]
 
+# All patterns folded into one alternation so each check is a single scan.
+# The script-tag patterns are subsumed by the generic tag check, which is
+# written as ``<[^<>]*[^>]>``: it matches exactly when ``<[^>]+>`` does, but
+# each run of text is scanned from one "<" only, so pathological inputs
+# like "<<<<..." stay linear instead of rescanning to the end per "<".
+_XSS_SCAN_PATTERNS: tuple[str, ...] = (
+    r"<[^<>]*[^>]>",
+    r"\bon\w+\s*=",
+    r"javascript\s*:",
+    r"vbscript\s*:",
+    r"data\s*:",
+    r"expression\s*\(",
+    r"eval\s*\(",
+)
+_XSS_COMBINED: re.Pattern[str] = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _XSS_SCAN_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Short values (names, labels, enum-like strings) repeat across requests,
+# so XSS verdicts and escaped forms are memoized in bounded LRUs.
+_XSS_CACHE_MAX_LEN = 256
+_XSS_CACHE_SIZE = 4096
+_SANITIZE_CACHE_MAX_LEN = 512
+_SANITIZE_CACHE_SIZE = 8192
+
+
+def _scan_xss(value: str) -> bool:
+    """Run the XSS pattern scan on a non-empty string."""
+    # Every pattern needs one of these characters ("&" may decode to "<"),
+    # so plain text is rejected with a few memchr scans and no regex work.
+    if (
+        "<" not in value
+        and "=" not in value
+        and ":" not in value
+        and "(" not in value
+        and "&" not in value
+    ):
+        return False
+
+    # Check against all XSS patterns
+    if _XSS_COMBINED.search(value):
+        return True
+
+    # Check for HTML entities that could be decoded to XSS.
+    # Entities always start with "&", so skip the decode pass without one.
+    if "&" not in value:
+        return False
+    decoded = html.unescape(value)
+    return decoded != value and _XSS_COMBINED.search(decoded) is not None
+
+
+_scan_xss_cached = lru_cache(maxsize=_XSS_CACHE_SIZE)(_scan_xss)
+
 
 def contains_xss(value: str) -> bool:
     """Check if a string contains potential XSS payloads.
@@ -55,19 +97,17 @@ def contains_xss(value: str) -> bool:
     if not value:
         return False
 
-    # Check against all XSS patterns
-    for pattern in XSS_PATTERNS:
-        if pattern.search(value):
-            return True
+    if len(value) <= _XSS_CACHE_MAX_LEN:
+        return _scan_xss_cached(value)
+    return _scan_xss(value)
 
-    # Check for HTML entities that could be decoded to XSS
-    decoded = html.unescape(value)
-    if decoded != value:
-        for pattern in XSS_PATTERNS:
-            if pattern.search(decoded):
-                return True
 
-    return False
+def _escape(value: str) -> str:
+    """HTML-escape special characters and remove null bytes."""
+    return html.escape(value, quote=True).replace("\x00", "")
+
+
+_sanitize_cached = lru_cache(maxsize=_SANITIZE_CACHE_SIZE)(_escape)
 
 
 def sanitize_string(value: str) -> str:
@@ -82,13 +122,9 @@ def sanitize_string(value: str) -> str:
     if not value:
         return value
 
-    # HTML escape special characters
-    sanitized = html.escape(value, quote=True)
-
-    # Remove null bytes
-    sanitized = sanitized.replace("\x00", "")
-
-    return sanitized
+    if len(value) <= _SANITIZE_CACHE_MAX_LEN:
+        return _sanitize_cached(value)
+    return _escape(value)
 
 
 def validate_no_xss(value: str) -> str:
@@ -115,6 +151,10 @@ SafeString = Annotated[str, AfterValidator(validate_no_xss)]
 def sanitize_dict(data: dict[str, Any]) -> dict[str, Any]:
     """Recursively sanitize all string values in a dictionary.
 
+    Walks nested dicts with an explicit stack instead of recursion. Exact
+    ``type() is`` checks run first; ``isinstance`` is only reached for
+    subclasses (e.g. str enums), preserving the original semantics.
+
     Args:
         data: Dictionary to sanitize.
 
@@ -122,21 +162,34 @@ def sanitize_dict(data: dict[str, Any]) -> dict[str, Any]:
         Dictionary with all string values sanitized.
     """
     result: dict[str, Any] = {}
-    for key, value in data.items():
-        if isinstance(value, str):
-            result[key] = sanitize_string(value)
-        elif isinstance(value, dict):
-            result[key] = sanitize_dict(value)
-        elif isinstance(value, list):
-            sanitized_list: list[Any] = [
-                sanitize_dict(item)
-                if isinstance(item, dict)
-                else sanitize_string(item)
-                if isinstance(item, str)
-                else item
-                for item in value
-            ]
-            result[key] = sanitized_list
-        else:
-            result[key] = value
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(data, result)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            kind = type(value)
+            if kind is str:
+                target[key] = sanitize_string(value)
+            elif kind is dict or isinstance(value, dict):
+                nested: dict[str, Any] = {}
+                target[key] = nested
+                stack.append((value, nested))
+            elif kind is list or isinstance(value, list):
+                sanitized_list: list[Any] = []
+                for item in value:
+                    item_kind = type(item)
+                    if item_kind is str:
+                        sanitized_list.append(sanitize_string(item))
+                    elif item_kind is dict or isinstance(item, dict):
+                        nested_item: dict[str, Any] = {}
+                        sanitized_list.append(nested_item)
+                        stack.append((item, nested_item))
+                    elif isinstance(item, str):
+                        sanitized_list.append(sanitize_string(item))
+                    else:
+                        sanitized_list.append(item)
+                target[key] = sanitized_list
+            elif isinstance(value, str):
+                target[key] = sanitize_string(value)
+            else:
+                target[key] = value
     return result
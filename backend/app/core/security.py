@@ -1,15 +1,34 @@
 """Security utilities: password hashing and JWT management."""
 
+import base64
+import binascii
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
+import anyio
 import bcrypt
 import jwt
+import orjson
 from jwt.exceptions import PyJWTError
 
 from app.core.config import settings
 
+# Verified-token cache: sha256(token) -> (subject, token_type, valid_until).
+# Only successful verifications are stored; entries never outlive the token.
+_token_cache: OrderedDict[bytes, tuple[str, str, float]] = OrderedDict()
+
+# Claims the HS256 fast path does not validate itself; tokens carrying any of
+# them (or unusual headers) are handed to PyJWT so semantics stay identical.
+_FULL_DECODE_CLAIMS = frozenset({"nbf", "iat", "aud", "iss"})
+_FAST_PATH_HEADER_KEYS = frozenset({"alg", "typ"})
+_NEEDS_FULL_DECODE = object()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -25,6 +44,18 @@ def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on a worker thread so bcrypt does not block the loop."""
+    return await anyio.to_thread.run_sync(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on a worker thread so bcrypt does not block the loop."""
+    return await anyio.to_thread.run_sync(hash_password, password)
+
+
 def create_token(
     subject: str | UUID,
     token_type: str,
@@ -72,21 +103,104 @@ def create_password_reset_token(user_id: str | UUID) -> str:
     return create_token(user_id, "reset")
 
 
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+@lru_cache(maxsize=4)
+def _hmac_template(secret_key: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state; copies skip re-deriving the key pads."""
+    return hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _decode_hs256(token: str, secret_key: str) -> Any:
+    """Verify an HS256 token directly with hmac.
+
+    Returns the payload, None when the token is invalid, or
+    ``_NEEDS_FULL_DECODE`` when the token uses features only PyJWT handles.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    header_b64, payload_b64, signature_b64 = parts
+
+    try:
+        header = orjson.loads(_b64url_decode(header_b64))
+        payload = orjson.loads(_b64url_decode(payload_b64))
+        signature = _b64url_decode(signature_b64)
+    except (binascii.Error, ValueError):
+        return None
+
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        return None
+    if header.get("alg") != "HS256":
+        return None
+    if not header.keys() <= _FAST_PATH_HEADER_KEYS:
+        return _NEEDS_FULL_DECODE
+    if not payload.keys().isdisjoint(_FULL_DECODE_CLAIMS):
+        return _NEEDS_FULL_DECODE
+
+    mac = _hmac_template(secret_key).copy()
+    mac.update(f"{header_b64}.{payload_b64}".encode("ascii"))
+    if not hmac.compare_digest(mac.digest(), signature):
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if isinstance(exp, bool) or not isinstance(exp, int | float):
+            return None
+        if exp <= time.time():
+            return None
+
+    return payload
+
+
 def decode_token(token: str) -> dict[str, Any] | None:
     """Decode and validate a JWT token."""
+    secret_key = settings.secret_key
+    algorithm = settings.algorithm
+    if algorithm == "HS256":
+        payload = _decode_hs256(token, secret_key)
+        if payload is not _NEEDS_FULL_DECODE:
+            return payload
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
-        )
+        payload = jwt.decode(token, secret_key, algorithms=[algorithm])
         return payload
     except PyJWTError:
         return None
 
 
+def clear_token_cache() -> None:
+    """Drop all cached token verifications."""
+    _token_cache.clear()
+
+
+def _cache_token(key: bytes, subject: str, payload: dict[str, Any]) -> None:
+    """Remember a verified token until the TTL or its own expiry, whichever first."""
+    valid_until = time.time() + settings.token_cache_ttl_seconds
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        valid_until = min(valid_until, float(exp))
+    _token_cache[key] = (subject, payload["type"], valid_until)
+    if len(_token_cache) > settings.token_cache_max_size:
+        _token_cache.popitem(last=False)
+
+
 def verify_token(token: str, expected_type: str) -> str | None:
     """Verify a token and return the subject if valid."""
+    cache_key: bytes | None = None
+    if settings.token_cache_enabled:
+        cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+        cached = _token_cache.get(cache_key)
+        if cached is not None:
+            subject, token_type, valid_until = cached
+            if time.time() < valid_until:
+                _token_cache.move_to_end(cache_key)
+                return subject if token_type == expected_type else None
+            _token_cache.pop(cache_key, None)
+
     payload = decode_token(token)
     if payload is None:
         return None
@@ -99,4 +213,7 @@ def verify_token(token: str, expected_type: str) -> str | None:
     if subject is None:
         return None
 
+    if cache_key is not None:
+        _cache_token(cache_key, subject, payload)
+
     return subject
@@ -0,0 +1,8 @@
+"""Shared time helpers."""
+
+from datetime import UTC, datetime
+
+
+def utc_now() -> datetime:
+    """Get current UTC datetime (naive, for PostgreSQL compatibility)."""
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -9,6 +9,8 @@ from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.time import utc_now
+
 
 class AnalysisStatus(str, Enum):
     """Status of an analysis task."""
@@ -29,7 +31,7 @@ class VideoAnalysisResponse(BaseModel):
     status: AnalysisStatus = Field(description="Current status of the analysis")
     message: str = Field(description="Human-readable status message")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Task creation timestamp",
     )
 
@@ -58,7 +60,7 @@ class AnalysisResult(BaseModel):
         description="Detailed metrics from analysis",
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Analysis timestamp",
     )
     completed_at: datetime | None = Field(
@@ -70,6 +72,8 @@ class AnalysisResult(BaseModel):
 class AnalysisError(BaseModel):
     """Error response model for analysis failures."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     error: str = Field(description="Error type")
     detail: str = Field(description="Detailed error message")
     session_id: str | None = Field(default=None, description="Session ID if available")
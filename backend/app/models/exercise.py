@@ -1,15 +1,15 @@
 """Exercise model for rehabilitation exercises."""
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
-from uuid import UUID, uuid4
+from typing import ClassVar
+from uuid import UUID
 
+from sqlalchemy import Index, column, true
 from sqlmodel import Field, Relationship, SQLModel
 
-
-def utc_now() -> datetime:
-    """Get current UTC datetime (naive, for PostgreSQL compatibility)."""
-    return datetime.now(UTC).replace(tzinfo=None)
+from app.core.ids import uuid7
+from app.core.time import utc_now
 
 
 class ExerciseCategory(str, Enum):
@@ -57,7 +57,19 @@ class Exercise(ExerciseBase, table=True):
 
     __tablename__ = "exercises"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    # Partial index for the catalogue listing (active exercises ordered by name).
+    # Planners only use it when the query repeats this predicate verbatim, so
+    # list_exercises filters with the same ``is_active == true()`` expression.
+    __table_args__: ClassVar = (
+        Index(
+            "ix_exercises_active_name",
+            "name",
+            postgresql_where=column("is_active") == true(),
+            sqlite_where=column("is_active") == true(),
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime | None = Field(default=None)
 
@@ -4,15 +4,13 @@ Stores reference videos showing correct exercise technique.
 These videos are NOT analyzed in real-time - they serve as instructional content.
 """
 
-from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from datetime import datetime
+from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
-
-def utc_now() -> datetime:
-    """Get current UTC datetime (naive, for PostgreSQL compatibility)."""
-    return datetime.now(UTC).replace(tzinfo=None)
+from app.core.ids import uuid7
+from app.core.time import utc_now
 
 
 class ExerciseVideoBase(SQLModel):
@@ -33,7 +31,7 @@ class ExerciseVideo(ExerciseVideoBase, table=True):
 
     __tablename__ = "exercise_videos"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     exercise_id: UUID = Field(foreign_key="exercises.id", index=True)
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime | None = Field(default=None)
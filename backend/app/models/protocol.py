@@ -1,14 +1,14 @@
 """Protocol models for rehabilitation protocols and their exercises."""
 
-from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from datetime import datetime
+from typing import ClassVar
+from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
-
-def utc_now() -> datetime:
-    """Return current UTC datetime (naive, for PostgreSQL compatibility)."""
-    return datetime.now(UTC).replace(tzinfo=None)
+from app.core.ids import uuid7
+from app.core.time import utc_now
 
 
 class ProtocolBase(SQLModel):
@@ -25,13 +25,16 @@ class Protocol(ProtocolBase, table=True):
 
     __tablename__ = "protocols"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime | None = Field(default=None)
 
-    # Relationships
+    # Relationships. Protocol -> ProtocolExercise -> Exercise is always read
+    # together; selectin loads each level in one IN (...) batch, so a protocol
+    # costs 3 queries regardless of exercise count and never lazy-loads async.
     protocol_exercises: list["ProtocolExercise"] = Relationship(
-        back_populates="protocol"
+        back_populates="protocol",
+        sa_relationship_kwargs={"lazy": "selectin"},
     )
 
 
@@ -52,12 +55,22 @@ class ProtocolExercise(ProtocolExerciseBase, table=True):
 
     __tablename__ = "protocol_exercises"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    # Foreign keys are not indexed automatically on PostgreSQL; these cover
+    # loading a protocol's exercises in order and the reverse exercise lookup
+    __table_args__: ClassVar = (
+        Index("ix_protocol_exercises_protocol_order", "protocol_id", "order"),
+        Index("ix_protocol_exercises_exercise", "exercise_id"),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     created_at: datetime = Field(default_factory=utc_now)
 
     # Relationships
     protocol: Protocol = Relationship(back_populates="protocol_exercises")
-    exercise: "Exercise" = Relationship(back_populates="protocol_exercises")
+    exercise: "Exercise" = Relationship(
+        back_populates="protocol_exercises",
+        sa_relationship_kwargs={"lazy": "selectin"},
+    )
 
 
 # Forward reference
@@ -1,17 +1,19 @@
 """Session model for tracking patient exercise sessions."""
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
 from typing import ClassVar
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Index
+from sqlalchemy import Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
+from app.core.ids import uuid7
+from app.core.time import utc_now
 
-def utc_now() -> datetime:
-    """Get current UTC datetime (naive, for PostgreSQL compatibility)."""
-    return datetime.now(UTC).replace(tzinfo=None)
+# Binary JSONB on PostgreSQL (parsed once on write); plain JSON elsewhere
+_JSON_TYPE = JSON().with_variant(JSONB(), "postgresql")
 
 
 class SessionStatus(str, Enum):
@@ -44,16 +46,27 @@ class Session(SessionBase, table=True):
         Index("ix_sessions_patient_status", "patient_id", "status"),
         Index("ix_sessions_patient_scheduled", "patient_id", "scheduled_date"),
         Index("ix_sessions_status_scheduled", "status", "scheduled_date"),
+        # Per-patient history ordered by completion; replaces the
+        # single-column completed_at index
+        Index("ix_sessions_patient_completed", "patient_id", "completed_at"),
+        # Only the few in-progress rows; Enum columns store member names
+        Index(
+            "ix_sessions_in_progress",
+            "patient_id",
+            "scheduled_date",
+            postgresql_where=text("status = 'IN_PROGRESS'"),
+            sqlite_where=text("status = 'IN_PROGRESS'"),
+        ),
     )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     patient_id: UUID = Field(foreign_key="users.id", index=True)
     started_at: datetime | None = Field(default=None)
-    completed_at: datetime | None = Field(default=None, index=True)
+    completed_at: datetime | None = Field(default=None)
     duration_seconds: int | None = Field(default=None)
     created_at: datetime = Field(default_factory=utc_now, index=True)
     # Device info for debugging
-    device_info: dict = Field(default_factory=dict, sa_column=Column(JSON))
+    device_info: dict = Field(default_factory=dict, sa_column=Column(_JSON_TYPE))
 
     # Relationships
     patient: "User" = Relationship(back_populates="sessions")
@@ -77,7 +90,7 @@ class SessionExerciseResult(SQLModel, table=True):
         Index("ix_session_results_session_exercise", "session_id", "exercise_id"),
     )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     session_id: UUID = Field(foreign_key="sessions.id", index=True)
     exercise_id: UUID = Field(foreign_key="exercises.id", index=True)
     sets_completed: int = Field(default=0)
@@ -1,18 +1,15 @@
 """User model for authentication and authorization."""
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import EmailStr, field_validator
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.core.ids import uuid7
 from app.core.sanitizer import contains_xss
-
-
-def utc_now() -> datetime:
-    """Get current UTC datetime (naive, for PostgreSQL compatibility)."""
-    return datetime.now(UTC).replace(tzinfo=None)
+from app.core.time import utc_now
 
 
 class UserRole(str, Enum):
@@ -37,7 +34,7 @@ class User(UserBase, table=True):
 
     __tablename__ = "users"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     hashed_password: str
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime | None = Field(default=None)
@@ -4,7 +4,12 @@ Production implementation using Resend.com API (3000 emails/month free).
 Falls back to logging when email_enabled=False.
 """
 
+from functools import lru_cache
+from html import escape
+from importlib.util import find_spec
+
 import httpx
+import orjson
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -13,6 +18,64 @@ logger = get_logger(__name__)
 
 RESEND_API_URL = "https://api.resend.com/emails"
 
+# HTTP/2 multiplexes concurrent sends over one connection; needs httpx[http2]
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Shared client so keep-alive connections to Resend are reused across sends
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(
+                max_connections=settings.resend_pool_limit,
+                max_keepalive_connections=settings.resend_max_keepalive_connections,
+                keepalive_expiry=settings.resend_keepalive_seconds,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def check_email_config() -> bool:
+    """Report at startup whether real email delivery is configured.
+
+    Logs once when sending is enabled but no Resend key is set, so the
+    misconfiguration shows up at deploy time rather than on the first signup.
+    """
+    if settings.email_enabled and not settings.resend_api_key:
+        logger.warning(
+            "resend_not_configured_at_startup",
+            hint="Set RESEND_API_KEY or EMAIL_ENABLED=false",
+        )
+        return False
+    return True
+
+
+@lru_cache(maxsize=4)
+def _auth_headers(api_key: str) -> dict[str, str]:
+    """Authorization header for Resend, built once per API key."""
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+@lru_cache(maxsize=4)
+def _from_field(from_name: str, from_email: str) -> str:
+    """Formatted sender address, built once per configured sender."""
+    return f"{from_name} <{from_email}>"
+
 
 async def _send_email(
     to_email: str,
@@ -37,39 +100,40 @@ async def _send_email(
         return False
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                RESEND_API_URL,
-                headers={
-                    "Authorization": f"Bearer {settings.resend_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "from": f"{settings.resend_from_name} <{settings.resend_from_email}>",
+        client = get_http_client()
+        response = await client.post(
+            RESEND_API_URL,
+            headers=_auth_headers(settings.resend_api_key),
+            content=orjson.dumps(
+                {
+                    "from": _from_field(
+                        settings.resend_from_name, settings.resend_from_email
+                    ),
                     "to": [to_email],
                     "subject": subject,
                     "html": html_body,
-                },
-            )
+                }
+            ),
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(
-                    "email_sent",
-                    to=to_email,
-                    subject=subject,
-                    message_id=data.get("id"),
-                )
-                return True
-            else:
-                logger.error(
-                    "email_send_failed",
-                    to=to_email,
-                    subject=subject,
-                    status_code=response.status_code,
-                    response=response.text,
-                )
-                return False
+        if response.is_success:
+            data = response.json()
+            logger.info(
+                "email_sent",
+                to=to_email,
+                subject=subject,
+                message_id=data.get("id"),
+            )
+            return True
+        else:
+            logger.error(
+                "email_send_failed",
+                to=to_email,
+                subject=subject,
+                status_code=response.status_code,
+                response=response.text,
+            )
+            return False
 
     except httpx.TimeoutException:
         logger.warning(
@@ -88,46 +152,46 @@ async def _send_email(
         return False
 
 
-async def send_verification_email(email: str, token: str) -> None:
-    """Send email verification link."""
-    verification_url = f"{settings.frontend_url}/verify-email?token={token}"
+# Head, logo and footer chrome shared by every email. Per-email CSS rules
+# and the body/footer content are slotted in by _render_email.
+_BASE_CSS = """
+            body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; }
+            .container { max-width: 600px; margin: 0 auto; padding: 40px 20px; }
+            .logo { font-size: 28px; font-weight: bold; color: #4F46E5; margin-bottom: 30px; }
+            .footer { margin-top: 40px; font-size: 13px; color: #6B7280; border-top: 1px solid #E5E7EB; padding-top: 20px; }
+"""
 
-    subject = "Verify Your Email - OrthoSense"
 
-    html_body = f"""
+def _button_css(color: str) -> str:
+    """CSS for the call-to-action button in a given accent color."""
+    return f"""\
+            .button {{
+                display: inline-block;
+                background-color: {color};
+                color: white !important;
+                padding: 14px 28px;
+                text-decoration: none;
+                border-radius: 8px;
+                font-weight: 600;
+            }}"""
+
+
+def _render_email(extra_css: str, content: str, footer: str) -> str:
+    """Wrap email content and footer lines in the shared OrthoSense layout."""
+    return f"""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 40px 20px; }}
-            .logo {{ font-size: 28px; font-weight: bold; color: #4F46E5; margin-bottom: 30px; }}
-            .button {{ 
-                display: inline-block; 
-                background-color: #4F46E5; 
-                color: white !important; 
-                padding: 14px 28px; 
-                text-decoration: none; 
-                border-radius: 8px;
-                font-weight: 600;
-            }}
-            .footer {{ margin-top: 40px; font-size: 13px; color: #6B7280; border-top: 1px solid #E5E7EB; padding-top: 20px; }}
+        <style>{_BASE_CSS}{extra_css}
         </style>
     </head>
     <body>
         <div class="container">
             <div class="logo">OrthoSense</div>
-            <h1 style="color: #111827;">Welcome! 👋</h1>
-            <p>Thank you for signing up for OrthoSense. Click the button below to verify your email address and get started:</p>
-            <p style="margin: 30px 0;">
-                <a href="{verification_url}" class="button">Verify Email Address</a>
-            </p>
-            <p style="font-size: 14px; color: #6B7280;">Or copy this link to your browser:</p>
-            <p style="word-break: break-all; color: #4F46E5; font-size: 14px;">{verification_url}</p>
+{content}
             <div class="footer">
-                <p>This link expires in {settings.verification_token_expire_hours} hours.</p>
-                <p>If you didn't create an OrthoSense account, please ignore this email.</p>
+{footer}
                 <p style="margin-top: 20px;">© 2026 OrthoSense. All rights reserved.</p>
             </div>
         </div>
@@ -135,40 +199,43 @@ async def send_verification_email(email: str, token: str) -> None:
     </html>
     """
 
+
+async def send_verification_email(email: str, token: str) -> None:
+    """Send email verification link."""
+    # Escaped once here since the URL lands in both an attribute and text
+    verification_url = escape(f"{settings.frontend_url}/verify-email?token={token}")
+
+    subject = "Verify Your Email - OrthoSense"
+
+    html_body = _render_email(
+        _button_css("#4F46E5"),
+        f"""\
+            <h1 style="color: #111827;">Welcome! 👋</h1>
+            <p>Thank you for signing up for OrthoSense. Click the button below to verify your email address and get started:</p>
+            <p style="margin: 30px 0;">
+                <a href="{verification_url}" class="button">Verify Email Address</a>
+            </p>
+            <p style="font-size: 14px; color: #6B7280;">Or copy this link to your browser:</p>
+            <p style="word-break: break-all; color: #4F46E5; font-size: 14px;">{verification_url}</p>""",
+        f"""\
+                <p>This link expires in {settings.verification_token_expire_hours} hours.</p>
+                <p>If you didn't create an OrthoSense account, please ignore this email.</p>""",
+    )
+
     await _send_email(email, subject, html_body)
 
 
 async def send_password_reset_email(email: str, token: str) -> None:
     """Send password reset link."""
-    reset_url = f"{settings.frontend_url}/reset-password?token={token}"
+    reset_url = escape(f"{settings.frontend_url}/reset-password?token={token}")
 
     subject = "Reset Your Password - OrthoSense"
 
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 40px 20px; }}
-            .logo {{ font-size: 28px; font-weight: bold; color: #4F46E5; margin-bottom: 30px; }}
-            .button {{ 
-                display: inline-block; 
-                background-color: #DC2626; 
-                color: white !important; 
-                padding: 14px 28px; 
-                text-decoration: none; 
-                border-radius: 8px;
-                font-weight: 600;
-            }}
-            .warning {{ background-color: #FEF3C7; padding: 16px; border-radius: 8px; margin: 20px 0; }}
-            .footer {{ margin-top: 40px; font-size: 13px; color: #6B7280; border-top: 1px solid #E5E7EB; padding-top: 20px; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="logo">OrthoSense</div>
+    html_body = _render_email(
+        _button_css("#DC2626")
+        + """
+            .warning { background-color: #FEF3C7; padding: 16px; border-radius: 8px; margin: 20px 0; }""",
+        f"""\
             <h1 style="color: #111827;">Password Reset 🔐</h1>
             <p>We received a request to reset the password for your OrthoSense account.</p>
             <p style="margin: 30px 0;">
@@ -178,39 +245,19 @@ async def send_password_reset_email(email: str, token: str) -> None:
             <p style="word-break: break-all; color: #DC2626; font-size: 14px;">{reset_url}</p>
             <div class="warning">
                 ⚠️ <strong>Important:</strong> This link expires in {settings.password_reset_token_expire_hours} hour.
-            </div>
-            <div class="footer">
-                <p>If you didn't request a password reset, please ignore this email. Your password will remain unchanged.</p>
-                <p style="margin-top: 20px;">© 2026 OrthoSense. All rights reserved.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+            </div>""",
+        """\
+                <p>If you didn't request a password reset, please ignore this email. Your password will remain unchanged.</p>""",
+    )
 
     await _send_email(email, subject, html_body)
 
 
-async def send_welcome_email(email: str) -> None:
-    """Send welcome email after verification."""
-    subject = "Welcome to OrthoSense! 🎉"
-
-    html_body = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; }
-            .container { max-width: 600px; margin: 0 auto; padding: 40px 20px; }
-            .logo { font-size: 28px; font-weight: bold; color: #4F46E5; margin-bottom: 30px; }
-            .highlight { background-color: #EEF2FF; padding: 24px; border-radius: 12px; margin: 24px 0; }
-            .footer { margin-top: 40px; font-size: 13px; color: #6B7280; border-top: 1px solid #E5E7EB; padding-top: 20px; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="logo">OrthoSense</div>
+# The welcome email has no per-user content, so it is rendered once at import
+_WELCOME_HTML = _render_email(
+    """\
+            .highlight { background-color: #EEF2FF; padding: 24px; border-radius: 12px; margin: 24px 0; }""",
+    """\
             <h1 style="color: #111827;">You're All Set! 🎉</h1>
             <p>Thank you for verifying your email address. Your OrthoSense account is now fully active.</p>
             <div class="highlight">
@@ -221,14 +268,14 @@ async def send_welcome_email(email: str) -> None:
                     <li>📊 Track your progress with AI-powered analysis</li>
                     <li>🎯 Achieve your recovery goals</li>
                 </ul>
-            </div>
-            <div class="footer">
-                <p>Have questions? We're here to help!</p>
-                <p style="margin-top: 20px;">© 2026 OrthoSense. All rights reserved.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+            </div>""",
+    """\
+                <p>Have questions? We're here to help!</p>""",
+)
 
-    await _send_email(email, subject, html_body)
+
+async def send_welcome_email(email: str) -> None:
+    """Send welcome email after verification."""
+    subject = "Welcome to OrthoSense! 🎉"
+
+    await _send_email(email, subject, _WELCOME_HTML)
@@ -1,13 +1,20 @@
+"""Pytest fixtures for async testing with authentication support.
+
+This is the first conftest pytest imports, so the environment below is in
+place before any test module (or nested conftest) pulls in app settings.
+"""
+
 import asyncio
 import os
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 # Set environment variables BEFORE importing app modules
@@ -20,50 +27,42 @@ from app.core.security import create_access_token, hash_password
 from app.main import app
 from app.models.user import User
 
-"""Pytest fixtures for async testing with authentication support."""
-
+# bcrypt is deliberately slow; hash the shared fixture password only once.
+_TEST_PW_HASH = hash_password("testpassword123")
 
-# Ensure clean event loop shutdown after all tests
-@pytest.fixture(scope="session", autouse=True)
-def event_loop_policy():
-    """Provide event loop policy and ensure clean shutdown."""
-    policy = asyncio.get_event_loop_policy()
-    yield policy
-    # Clean shutdown is handled by pytest-asyncio
+# Every test rolls back, so test_user can reuse one id and its access token.
+_TEST_USER_ID = uuid4()
 
 
-@pytest.fixture(scope="function", autouse=True)
-def cleanup_pending_tasks():
-    """Cancel any pending async tasks after each test."""
-    yield
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run tests on uvloop when installed, matching uvicorn[standard] in prod."""
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            return
-        pending = asyncio.all_tasks(loop)
-        for task in pending:
-            if not task.done() and not task.cancelled():
-                task.cancel()
-    except RuntimeError:
-        pass
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_engine():
-    """Create in-memory SQLite engine for tests."""
+    """Create the in-memory SQLite engine and schema once per test run."""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
         connect_args={"check_same_thread": False},
     )
-    import os
 
-    """Pytest fixtures for async testing with authentication support."""
+    # pysqlite defers BEGIN until the first DML statement, which breaks
+    # SAVEPOINT semantics; emit BEGIN ourselves so the outer transaction
+    # really wraps each test.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _record) -> None:
+        dbapi_connection.isolation_level = None
 
-    # Set environment variables BEFORE importing app modules
-    os.environ["SECRET_KEY"] = "test_secret_key_for_pytest_only_12345"
-    os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
-    os.environ["RATE_LIMIT_ENABLED"] = "false"  # Disable rate limiting in tests
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
@@ -71,20 +70,33 @@ async def async_engine():
     await engine.dispose()
 
 
-@pytest_asyncio.fixture
-async def session(async_engine) -> AsyncGenerator[AsyncSession]:
-    """Provide test database session."""
-    async_session_factory = sessionmaker(
-        async_engine,
-        class_=AsyncSession,
+@pytest.fixture(scope="session")
+def async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Build the session factory once; each test binds it to its connection."""
+    return async_sessionmaker(
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
-    async with async_session_factory() as session:
+
+
+@pytest_asyncio.fixture
+async def session(
+    async_engine, async_session_factory: async_sessionmaker[AsyncSession]
+) -> AsyncGenerator[AsyncSession]:
+    """Provide a test database session rolled back after each test.
+
+    The session joins an outer transaction via SAVEPOINTs, so ``commit()``
+    calls in tests and endpoints only release a savepoint and the whole test
+    is undone on teardown without recreating the schema.
+    """
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = async_session_factory(bind=connection)
         try:
             yield session
         finally:
             await session.close()
-            # Note: Do NOT dispose engine here - async_engine fixture handles cleanup
+            await transaction.rollback()
 
 
 @pytest_asyncio.fixture
@@ -109,15 +121,14 @@ async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient]:
 async def test_user(session: AsyncSession) -> User:
     """Create a test user in the database."""
     user = User(
-        id=uuid4(),
+        id=_TEST_USER_ID,
         email="test@example.com",
-        hashed_password=hash_password("testpassword123"),
+        hashed_password=_TEST_PW_HASH,
         is_active=True,
         is_verified=True,
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     return user
 
 
@@ -127,20 +138,25 @@ async def unverified_user(session: AsyncSession) -> User:
     user = User(
         id=uuid4(),
         email="unverified@example.com",
-        hashed_password=hash_password("testpassword123"),
+        hashed_password=_TEST_PW_HASH,
         is_active=True,
         is_verified=False,
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     return user
 
 
+@lru_cache(maxsize=8)
+def _cached_access_token(user_id: str) -> str:
+    """Sign each fixture user's access token once per test run."""
+    return create_access_token(user_id)
+
+
 @pytest_asyncio.fixture
 async def auth_headers(test_user: User) -> dict[str, str]:
     """Generate authorization headers for test user."""
     # Access user.id in async context to avoid MissingGreenlet error
     user_id = test_user.id
-    token = create_access_token(user_id)
+    token = _cached_access_token(str(user_id))
     return {"Authorization": f"Bearer {token}"}
@@ -5,19 +5,34 @@ E2E tests run against a test database and test the complete
 API workflows without mocking.
 
 Note: These tests require PostgreSQL. They are skipped if PG is unavailable.
+
+The suite can be sharded with pytest-xdist (``pytest -n auto --dist=loadfile
+tests/e2e``). In-memory SQLite is already private to each worker process;
+on PostgreSQL each worker gets its own ``<database>_<worker>`` database.
+
+Set ``E2E_FAST_HASH=1`` to hash test passwords at bcrypt's minimum cost
+factor, so /auth/login verifies them in about a millisecond.
 """
 
+import itertools
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from datetime import UTC, datetime
+from uuid import uuid4
 
+import bcrypt
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
 from app.core.database import get_session
+from app.core.security import create_access_token, hash_password
 from app.main import app
+from app.models.user import User, UserRole
 
 # Test database URL - falls back to SQLite for CI
 E2E_DATABASE_URL = os.environ.get(
@@ -28,15 +43,67 @@ E2E_DATABASE_URL = os.environ.get(
 # Determine if using PostgreSQL
 IS_POSTGRES = "postgresql" in E2E_DATABASE_URL
 
+# Set by pytest-xdist in worker processes (gw0, gw1, ...)
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+if IS_POSTGRES and XDIST_WORKER:
+    _url = make_url(E2E_DATABASE_URL)
+    E2E_DATABASE_URL = _url.set(
+        database=f"{_url.database}_{XDIST_WORKER}"
+    ).render_as_string(hide_password=False)
+
+# Opt-in: hashes made at cost 4 still go through bcrypt.checkpw on login, they
+# are just ~256x cheaper than the default cost 12. Only the E2E password
+# hashes below use it; bcrypt itself and the app's hashing are untouched.
+_FAST_HASH_ROUNDS = 4 if os.environ.get("E2E_FAST_HASH") == "1" else None
+
+# Run-wide sequence for test emails; unique even if a rollback ever leaks
+_email_seq = itertools.count()
+
+# Fixed passwords used by E2E test users
+_TEST_PASSWORDS = ("password123", "SecurePass123!")
+
+
+def _hash_test_password(password: str) -> str:
+    """Hash an E2E test password, at bcrypt's minimum cost if opted in."""
+    if _FAST_HASH_ROUNDS is None:
+        return hash_password(password)
+    salt = bcrypt.gensalt(rounds=_FAST_HASH_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+async def _ensure_postgres_database(url: str) -> None:
+    """Create the (per-worker) PostgreSQL database if it does not exist yet."""
+    target = make_url(url)
+    admin_engine = create_async_engine(
+        target.set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
+    )
+    try:
+        async with admin_engine.connect() as conn:
+            exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": target.database},
+            )
+            if not exists:
+                await conn.execute(text(f'CREATE DATABASE "{target.database}"'))
+    finally:
+        await admin_engine.dispose()
+
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def e2e_engine():
-    """Create database engine for E2E tests."""
+    """Create the E2E database engine and schema once per test run."""
     if IS_POSTGRES:
+        if XDIST_WORKER:
+            await _ensure_postgres_database(E2E_DATABASE_URL)
+        # asyncpg connections are bound to the loop that opened them; without
+        # pooling each test connects on its own loop.
         engine = create_async_engine(
             E2E_DATABASE_URL,
             echo=False,
-            pool_pre_ping=True,
+            poolclass=NullPool,
         )
     else:
         engine = create_async_engine(
@@ -45,6 +112,17 @@ async def e2e_engine():
             connect_args={"check_same_thread": False},
         )
 
+        # pysqlite defers BEGIN until the first DML statement, which breaks
+        # SAVEPOINT semantics; emit BEGIN ourselves so the outer transaction
+        # really wraps each test.
+        @event.listens_for(engine.sync_engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, _record) -> None:
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _emit_begin(conn) -> None:
+            conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
@@ -62,39 +140,114 @@ async def session(e2e_engine) -> AsyncGenerator[AsyncSession]:
     """
     Provide a transactional database session for E2E tests.
 
-    Each test runs in its own transaction that is rolled back,
-    ensuring test isolation.
+    Each test runs inside an outer transaction that is rolled back, ensuring
+    test isolation. The session joins it through SAVEPOINTs, so ``commit()``
+    inside tests and endpoints behaves normally without persisting anything.
     """
-    E2ESessionLocal = async_sessionmaker(
-        e2e_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    async with E2ESessionLocal() as db_session:
-        yield db_session
-        await db_session.rollback()
+    async with e2e_engine.connect() as connection:
+        transaction = await connection.begin()
+        db_session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield db_session
+        finally:
+            await db_session.close()
+            await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _asgi_client() -> AsyncGenerator[AsyncClient]:
+    """Build the ASGI transport and HTTP client once for the whole run."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _warm_app(_asgi_client: AsyncClient) -> None:
+    """Pay FastAPI's one-time schema and dependency setup before any test.
+
+    The OpenAPI build walks every route, and an unauthenticated request
+    primes the auth dependency chain, so the first real test is not skewed.
+    """
+    await _asgi_client.get(app.openapi_url)
+    await _asgi_client.get("/api/v1/sessions")
 
 
 @pytest_asyncio.fixture
-async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient]:
+async def client(
+    _asgi_client: AsyncClient, session: AsyncSession
+) -> AsyncGenerator[AsyncClient]:
     """
     Provide an async HTTP client configured for E2E testing.
 
-    Overrides the database session dependency to use the test session.
+    The client is shared across tests; only the database session dependency
+    override is swapped per test and cookies are cleared afterwards.
+    ASGITransport calls the app directly, so no sockets or pooled
+    connections carry over between tests.
     """
 
     async def override_get_session() -> AsyncGenerator[AsyncSession]:
         yield session
 
     app.dependency_overrides[get_session] = override_get_session
+    try:
+        yield _asgi_client
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        _asgi_client.cookies.clear()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as test_client:
-        yield test_client
 
-    app.dependency_overrides.clear()
+@pytest.fixture(scope="session")
+def password_hashes() -> dict[str, str]:
+    """bcrypt is deliberately slow; hash each fixed test password once per run."""
+    return {pw: _hash_test_password(pw) for pw in _TEST_PASSWORDS}
+
+
+@pytest.fixture
+def email_factory() -> Callable[[str], str]:
+    """Provide a factory for short, run-unique test emails."""
+
+    def _next(prefix: str = "u") -> str:
+        return f"{prefix}_{next(_email_seq)}@example.com"
+
+    return _next
+
+
+@pytest_asyncio.fixture
+async def make_user(
+    session: AsyncSession,
+    password_hashes: dict[str, str],
+) -> Callable[..., Awaitable[tuple[User, dict[str, str]]]]:
+    """
+    Provide a factory that creates a verified user and its auth headers.
+
+    The access token is minted directly, so tests that only need an
+    authenticated caller skip the /auth/login round-trip and its bcrypt check.
+    """
+
+    async def _make(
+        email: str, role: UserRole = UserRole.PATIENT
+    ) -> tuple[User, dict[str, str]]:
+        user = User(
+            id=uuid4(),
+            email=email,
+            hashed_password=password_hashes["password123"],
+            role=role,
+            is_active=True,
+            is_verified=True,
+        )
+        session.add(user)
+        await session.flush()
+        token = create_access_token(user.id)
+        return user, {"Authorization": f"Bearer {token}"}
+
+    return _make
 
 
 @pytest_asyncio.fixture
@@ -5,6 +5,7 @@ Tests the full user journey from authentication through exercise
 completion and result viewing.
 """
 
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from uuid import uuid4
 
@@ -12,13 +13,18 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
 from app.models.exercise import BodyPart, Exercise, ExerciseCategory
-from app.models.session import Session, SessionStatus
+from app.models.session import Session
 from app.models.user import User, UserRole
 
 pytestmark = pytest.mark.asyncio
 
+# Signature of the conftest ``make_user`` factory: email -> (user, headers)
+MakeUser = Callable[[str], Awaitable[tuple[User, dict[str, str]]]]
+
+# Signature of the conftest ``email_factory`` fixture: prefix -> unique email
+EmailFactory = Callable[[str], str]
+
 
 class TestExerciseSessionE2E:
     """
@@ -38,14 +44,17 @@ class TestExerciseSessionE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        email_factory: EmailFactory,
+        password_hashes: dict[str, str],
     ) -> None:
         """Test the complete happy path for an exercise session."""
+        email = email_factory("patient")
         # === SETUP ===
         # Create test user
         user = User(
             id=uuid4(),
-            email="e2e_patient@example.com",
-            hashed_password=hash_password("SecurePass123!"),
+            email=email,
+            hashed_password=password_hashes["SecurePass123!"],
             role=UserRole.PATIENT,
             is_active=True,
             is_verified=True,
@@ -62,13 +71,13 @@ class TestExerciseSessionE2E:
             is_active=True,
         )
         session.add(exercise)
-        await session.commit()
+        await session.flush()
 
         # === STEP 1: LOGIN ===
         login_response = await client.post(
             "/api/v1/auth/login",
             data={
-                "username": "e2e_patient@example.com",
+                "username": email,
                 "password": "SecurePass123!",
             },
         )
@@ -160,10 +169,8 @@ class TestExerciseSessionE2E:
         assert len(history) >= 1
 
         # Find our session
-        our_session = next(
-            (s for s in history if s["id"] == session_id),
-            None,
-        )
+        sessions_by_id = {s["id"]: s for s in history}
+        our_session = sessions_by_id.get(session_id)
         assert our_session is not None
 
     async def test_session_creation_requires_auth(
@@ -183,46 +190,24 @@ class TestExerciseSessionE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        make_user: MakeUser,
+        email_factory: EmailFactory,
     ) -> None:
         """Test that users can only view their own sessions."""
-        # Create two users
-        user1 = User(
-            id=uuid4(),
-            email="user1_e2e@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
-        user2 = User(
-            id=uuid4(),
-            email="user2_e2e@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
-        session.add_all([user1, user2])
-        await session.commit()
-
-        # Create session for user1
+        # Create user1, then stage their session so user2's flush writes it
+        user1, _ = await make_user(email_factory("user1"))
         user1_session = Session(
             id=uuid4(),
             patient_id=user1.id,
             scheduled_date=datetime.now(UTC),
         )
         session.add(user1_session)
-        await session.commit()
-
-        # Login as user2
-        login = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user2_e2e@example.com", "password": "password123"},
-        )
-        token = login.json()["access_token"]
+        _, user2_headers = await make_user(email_factory("user2"))
 
-        # Try to access user1's session
+        # Try to access user1's session as user2
         response = await client.get(
             f"/api/v1/sessions/{user1_session.id}",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=user2_headers,
         )
         assert response.status_code == 403
 
@@ -230,25 +215,11 @@ class TestExerciseSessionE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        make_user: MakeUser,
+        email_factory: EmailFactory,
     ) -> None:
         """Test skipping a scheduled session."""
-        user = User(
-            id=uuid4(),
-            email="skip_e2e@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
-        session.add(user)
-        await session.commit()
-
-        # Login
-        login = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "skip_e2e@example.com", "password": "password123"},
-        )
-        token = login.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
+        _, headers = await make_user(email_factory("skip"))
 
         # Create session
         create = await client.post(
@@ -271,15 +242,10 @@ class TestExerciseSessionE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        make_user: MakeUser,
+        email_factory: EmailFactory,
     ) -> None:
         """Test submitting multiple exercise results in a single session."""
-        user = User(
-            id=uuid4(),
-            email="multi_e2e@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
         exercises = [
             Exercise(
                 id=uuid4(),
@@ -290,17 +256,9 @@ class TestExerciseSessionE2E:
             )
             for i in range(3)
         ]
-        session.add(user)
         session.add_all(exercises)
-        await session.commit()
-
-        # Login
-        login = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "multi_e2e@example.com", "password": "password123"},
-        )
-        token = login.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
+        # make_user's flush writes the exercises along with the user
+        _, headers = await make_user(email_factory("multi"))
 
         # Create and start session
         create = await client.post(
@@ -342,194 +300,6 @@ class TestExerciseSessionE2E:
         assert len(session_data["exercise_results"]) == 3
 
 
-class TestExerciseSessionErrorHandling:
-    """E2E tests for error scenarios in exercise sessions."""
-
-    async def test_cannot_complete_not_started_session(
-        self,
-        client: AsyncClient,
-        session: AsyncSession,
-    ) -> None:
-        """Test that completing a session that wasn't started fails."""
-        user = User(
-            id=uuid4(),
-            email="notstarted@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
-        session.add(user)
-        await session.commit()
-
-        login = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "notstarted@example.com", "password": "password123"},
-        )
-        token = login.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Create session without starting
-        create = await client.post(
-            "/api/v1/sessions",
-            headers=headers,
-            json={"scheduled_date": datetime.now(UTC).isoformat()},
-        )
-        session_id = create.json()["id"]
-
-        # Try to complete without starting
-        complete = await client.post(
-            f"/api/v1/sessions/{session_id}/complete",
-            headers=headers,
-            json={"pain_level_after": 2},
-        )
-        # Currently allowed - session can be completed without starting
-        # (duration_seconds will be None)
-        assert complete.status_code == 200
-
-    async def test_cannot_start_completed_session(
-        self,
-        client: AsyncClient,
-        session: AsyncSession,
-    ) -> None:
-        """Test that starting an already completed session fails."""
-        user = User(
-            id=uuid4(),
-            email="restart@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
-        session.add(user)
-
-        # Create already completed session
-        completed_session = Session(
-            id=uuid4(),
-            patient_id=user.id,
-            scheduled_date=datetime.now(UTC),
-            status=SessionStatus.COMPLETED,
-        )
-        session.add(completed_session)
-        await session.commit()
-
-        login = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "restart@example.com", "password": "password123"},
-        )
-        token = login.json()["access_token"]
-
-        # Try to start completed session
-        start = await client.post(
-            f"/api/v1/sessions/{completed_session.id}/start",
-            headers={"Authorization": f"Bearer {token}"},
-            json={"pain_level_before": 5},
-        )
-        assert start.status_code == 400
-
-    async def test_submit_result_for_nonexistent_exercise(
-        self,
-        client: AsyncClient,
-        session: AsyncSession,
-    ) -> None:
-        """Test that submitting result for non-existent exercise fails."""
-        user = User(
-            id=uuid4(),
-            email="badexercise@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
-        session.add(user)
-        await session.commit()
-
-        login = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "badexercise@example.com", "password": "password123"},
-        )
-        token = login.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
-        create = await client.post(
-            "/api/v1/sessions",
-            headers=headers,
-            json={"scheduled_date": datetime.now(UTC).isoformat()},
-        )
-        session_id = create.json()["id"]
-
-        await client.post(
-            f"/api/v1/sessions/{session_id}/start",
-            headers=headers,
-            json={"pain_level_before": 3},
-        )
-
-        # Submit result for non-existent exercise
-        result = await client.post(
-            f"/api/v1/sessions/{session_id}/results",
-            headers=headers,
-            json={
-                "exercise_id": str(uuid4()),  # Non-existent
-                "sets_completed": 3,
-                "reps_completed": 10,
-                "score": 85.0,
-            },
-        )
-        assert result.status_code == 404
-
-
-class TestExerciseSessionPainTracking:
-    """E2E tests for pain level tracking during sessions."""
-
-    async def test_pain_improvement_tracking(
-        self,
-        client: AsyncClient,
-        session: AsyncSession,
-    ) -> None:
-        """Test tracking pain improvement before and after session."""
-        user = User(
-            id=uuid4(),
-            email="pain_track@example.com",
-            hashed_password=hash_password("password123"),
-            is_active=True,
-            is_verified=True,
-        )
-        session.add(user)
-        await session.commit()
-
-        login = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "pain_track@example.com", "password": "password123"},
-        )
-        token = login.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Create and complete session with pain tracking
-        create = await client.post(
-            "/api/v1/sessions",
-            headers=headers,
-            json={"scheduled_date": datetime.now(UTC).isoformat()},
-        )
-        session_id = create.json()["id"]
-
-        # Start with pain level 7
-        await client.post(
-            f"/api/v1/sessions/{session_id}/start",
-            headers=headers,
-            json={"pain_level_before": 7},
-        )
-
-        # Complete with pain level 3 (improvement)
-        complete = await client.post(
-            f"/api/v1/sessions/{session_id}/complete",
-            headers=headers,
-            json={"pain_level_after": 3},
-        )
-
-        if complete.status_code == 200:
-            data = complete.json()
-            assert data["pain_level_before"] == 7
-            assert data["pain_level_after"] == 3
-            # Pain decreased by 4 points - improvement!
-
-
 class TestExerciseAnalysisE2E:
     """E2E tests for exercise analysis with pose estimation."""
 
@@ -538,12 +308,15 @@ class TestExerciseAnalysisE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        email_factory: EmailFactory,
+        password_hashes: dict[str, str],
     ) -> None:
         """Test uploading pose landmark data for exercise analysis."""
+        email = email_factory("analysis")
         user = User(
             id=uuid4(),
-            email="analysis@example.com",
-            hashed_password=hash_password("password123"),
+            email=email,
+            hashed_password=password_hashes["password123"],
             is_active=True,
             is_verified=True,
         )
@@ -555,11 +328,11 @@ class TestExerciseAnalysisE2E:
             is_active=True,
         )
         session.add_all([user, exercise])
-        await session.commit()
+        await session.flush()
 
         login = await client.post(
             "/api/v1/auth/login",
-            data={"username": "analysis@example.com", "password": "password123"},
+            data={"username": email, "password": "password123"},
         )
         token = login.json()["access_token"]
         headers = {"Authorization": f"Bearer {token}"}
@@ -607,21 +380,24 @@ class TestExerciseAnalysisE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        email_factory: EmailFactory,
+        password_hashes: dict[str, str],
     ) -> None:
         """Test retrieving historical analysis results."""
+        email = email_factory("history")
         user = User(
             id=uuid4(),
-            email="history@example.com",
-            hashed_password=hash_password("password123"),
+            email=email,
+            hashed_password=password_hashes["password123"],
             is_active=True,
             is_verified=True,
         )
         session.add(user)
-        await session.commit()
+        await session.flush()
 
         login = await client.post(
             "/api/v1/auth/login",
-            data={"username": "history@example.com", "password": "password123"},
+            data={"username": email, "password": "password123"},
         )
         token = login.json()["access_token"]
 
@@ -645,20 +421,23 @@ class TestTherapistPatientE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        email_factory: EmailFactory,
+        password_hashes: dict[str, str],
     ) -> None:
         """Test therapist assigning exercise program to patient."""
+        therapist_email = email_factory("therapist")
         therapist = User(
             id=uuid4(),
-            email="therapist@example.com",
-            hashed_password=hash_password("password123"),
+            email=therapist_email,
+            hashed_password=password_hashes["password123"],
             role=UserRole.THERAPIST,
             is_active=True,
             is_verified=True,
         )
         patient = User(
             id=uuid4(),
-            email="patient_assigned@example.com",
-            hashed_password=hash_password("password123"),
+            email=email_factory("patient"),
+            hashed_password=password_hashes["password123"],
             role=UserRole.PATIENT,
             is_active=True,
             is_verified=True,
@@ -671,12 +450,12 @@ class TestTherapistPatientE2E:
             is_active=True,
         )
         session.add_all([therapist, patient, exercise])
-        await session.commit()
+        await session.flush()
 
         # Login as therapist
         login = await client.post(
             "/api/v1/auth/login",
-            data={"username": "therapist@example.com", "password": "password123"},
+            data={"username": therapist_email, "password": "password123"},
         )
         token = login.json()["access_token"]
         headers = {"Authorization": f"Bearer {token}"}
@@ -707,31 +486,34 @@ class TestTherapistPatientE2E:
         self,
         client: AsyncClient,
         session: AsyncSession,
+        email_factory: EmailFactory,
+        password_hashes: dict[str, str],
     ) -> None:
         """Test therapist viewing patient's progress."""
+        therapist_email = email_factory("therapist")
         therapist = User(
             id=uuid4(),
-            email="therapist_view@example.com",
-            hashed_password=hash_password("password123"),
+            email=therapist_email,
+            hashed_password=password_hashes["password123"],
             role=UserRole.THERAPIST,
             is_active=True,
             is_verified=True,
         )
         patient = User(
             id=uuid4(),
-            email="patient_progress@example.com",
-            hashed_password=hash_password("password123"),
+            email=email_factory("patient"),
+            hashed_password=password_hashes["password123"],
             role=UserRole.PATIENT,
             is_active=True,
             is_verified=True,
         )
         session.add_all([therapist, patient])
-        await session.commit()
+        await session.flush()
 
         # Login as therapist
         login = await client.post(
             "/api/v1/auth/login",
-            data={"username": "therapist_view@example.com", "password": "password123"},
+            data={"username": therapist_email, "password": "password123"},
         )
         token = login.json()["access_token"]
 
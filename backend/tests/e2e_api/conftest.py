@@ -9,11 +9,6 @@ import os
 from collections.abc import AsyncGenerator
 from uuid import uuid4
 
-# Set environment variables BEFORE importing app modules
-os.environ["SECRET_KEY"] = "e2e_test_secret_key_for_pytest_only_12345"
-os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
-os.environ["RATE_LIMIT_ENABLED"] = "false"  # Disable rate limiting in E2E tests
-
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
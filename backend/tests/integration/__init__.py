@@ -13,8 +13,7 @@ from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 # Use test database - either from env or default local PostgreSQL
@@ -55,9 +54,8 @@ async def pg_engine():
 @pytest_asyncio.fixture
 async def pg_session(pg_engine) -> AsyncGenerator[AsyncSession]:
     """Provide PostgreSQL test session with transaction rollback."""
-    async_session_factory = sessionmaker(
+    async_session_factory = async_sessionmaker(
         pg_engine,
-        class_=AsyncSession,
         expire_on_commit=False,
     )
     async with async_session_factory() as session, session.begin():
@@ -70,9 +68,8 @@ async def pg_session(pg_engine) -> AsyncGenerator[AsyncSession]:
 @pytest_asyncio.fixture
 async def pg_session_committed(pg_engine) -> AsyncGenerator[AsyncSession]:
     """Provide PostgreSQL session that commits (for testing real persistence)."""
-    async_session_factory = sessionmaker(
+    async_session_factory = async_sessionmaker(
         pg_engine,
-        class_=AsyncSession,
         expire_on_commit=False,
     )
     async with async_session_factory() as session:
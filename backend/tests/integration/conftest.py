@@ -13,8 +13,7 @@ from collections.abc import AsyncGenerator
 from uuid import uuid4
 
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 from app.core.security import hash_password
@@ -56,9 +55,8 @@ async def pg_engine():
 @pytest_asyncio.fixture
 async def pg_session(pg_engine) -> AsyncGenerator[AsyncSession]:
     """Provide test session with transaction rollback."""
-    async_session_factory = sessionmaker(
+    async_session_factory = async_sessionmaker(
         pg_engine,
-        class_=AsyncSession,
         expire_on_commit=False,
     )
     async with async_session_factory() as session:
@@ -69,9 +67,8 @@ async def pg_session(pg_engine) -> AsyncGenerator[AsyncSession]:
 @pytest_asyncio.fixture
 async def pg_session_committed(pg_engine) -> AsyncGenerator[AsyncSession]:
     """Provide session that commits (for testing real persistence)."""
-    async_session_factory = sessionmaker(
+    async_session_factory = async_sessionmaker(
         pg_engine,
-        class_=AsyncSession,
         expire_on_commit=False,
     )
     async with async_session_factory() as session:
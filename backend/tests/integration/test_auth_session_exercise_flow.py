@@ -19,8 +19,7 @@ os.environ["RATE_LIMIT_ENABLED"] = "false"
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 from app.core.database import get_session
@@ -52,9 +51,8 @@ async def async_engine():
 @pytest_asyncio.fixture
 async def session(async_engine) -> AsyncSession:
     """Provide test database session."""
-    async_session_factory = sessionmaker(
+    async_session_factory = async_sessionmaker(
         async_engine,
-        class_=AsyncSession,
         expire_on_commit=False,
     )
     async with async_session_factory() as session:
@@ -11,6 +11,7 @@ Test coverage:
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,7 +21,7 @@ from app.models.exercise_video import ExerciseVideo
 from app.models.user import User, UserRole
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def admin_user(session: AsyncSession) -> User:
     """Create an admin user."""
     admin = User(
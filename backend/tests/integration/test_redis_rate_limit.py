@@ -115,10 +115,12 @@ class TestRateLimiterWithRedis:
     @pytest.mark.asyncio
     async def test_redis_connection_caching(self) -> None:
         """Redis client is cached after first connection."""
+        from app.core import rate_limit as rate_limit_module
+
         limiter = RateLimiter(requests=10, window_seconds=60, use_redis=True)
 
         # Initially no client
-        assert limiter._redis_client is None
+        assert rate_limit_module._redis_client is None
 
         # After _get_redis call, client should be cached (or None if unavailable)
         await limiter._get_redis()
@@ -13,6 +13,7 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -25,7 +26,7 @@ from app.models.session import (
 from app.models.user import User
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def exercises(session: AsyncSession) -> list[Exercise]:
     """Create test exercises."""
     exercises = [
@@ -190,6 +190,21 @@ class TestEmailEdgeCases:
             _, _, html_body = call_args
             assert token in html_body
 
+    @pytest.mark.asyncio
+    async def test_reset_url_is_html_escaped(self) -> None:
+        """Markup in the token cannot break out of the link attribute."""
+        token = 'x"><script>alert(1)</script>&y'
+
+        with patch(
+            "app.services.email._send_email", new_callable=AsyncMock
+        ) as mock_send:
+            await send_password_reset_email("test@example.com", token)
+
+            _, _, html_body = mock_send.call_args[0]
+            assert "<script>" not in html_body
+            assert "token=x&quot;&gt;&lt;script&gt;" in html_body
+            assert "&amp;y" in html_body
+
     @pytest.mark.asyncio
     async def test_password_reset_with_unicode_email(self) -> None:
         """Unicode in email domain is handled."""
@@ -296,12 +311,13 @@ class TestResendAPIIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.is_success = True
         mock_response.json.return_value = {"id": "test-message-id"}
 
         with (
             patch("app.services.email.settings") as mock_settings,
             patch("app.services.email.logger") as mock_logger,
-            patch("httpx.AsyncClient") as mock_client_class,
+            patch("app.services.email.get_http_client") as mock_get_client,
         ):
             mock_settings.email_enabled = True
             mock_settings.resend_api_key = "test-api-key"
@@ -312,8 +328,7 @@ class TestResendAPIIntegration:
 
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await send_verification_email(email, token)
 
@@ -332,12 +347,13 @@ class TestResendAPIIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 400
+        mock_response.is_success = False
         mock_response.text = "Bad Request"
 
         with (
             patch("app.services.email.settings") as mock_settings,
             patch("app.services.email.logger") as mock_logger,
-            patch("httpx.AsyncClient") as mock_client_class,
+            patch("app.services.email.get_http_client") as mock_get_client,
         ):
             mock_settings.email_enabled = True
             mock_settings.resend_api_key = "test-api-key"
@@ -348,8 +364,7 @@ class TestResendAPIIntegration:
 
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await send_verification_email(email, token)
 
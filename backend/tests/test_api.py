@@ -1,5 +1,6 @@
 import httpx
 import pytest
+import pytest_asyncio
 
 # Skip tests when server isn't running
 pytestmark = pytest.mark.skip(reason="Requires running server at localhost:8000")
@@ -10,7 +11,7 @@ TEST_USER = "testuser@example.com"
 TEST_PASSWORD = "testpassword123"
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function")
 async def access_token():
     async with httpx.AsyncClient(base_url=BASE_URL) as client:
         register_data = {
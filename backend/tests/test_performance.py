@@ -24,8 +24,7 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 # Set environment variables BEFORE importing app modules
@@ -76,9 +75,8 @@ async def async_engine():
 @pytest_asyncio.fixture
 async def session(async_engine) -> AsyncSession:
     """Provide test database session."""
-    async_session_factory = sessionmaker(
+    async_session_factory = async_sessionmaker(
         async_engine,
-        class_=AsyncSession,
         expire_on_commit=False,
     )
     async with async_session_factory() as db_session:
@@ -5,12 +5,13 @@ as required by Engineering Thesis Section 10.4.1.
 """
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def client() -> AsyncClient:
     """Create async test client."""
     transport = ASGITransport(app=app)
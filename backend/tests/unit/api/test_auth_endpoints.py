@@ -24,7 +24,8 @@ from app.core.security import (
     create_verification_token,
     hash_password,
 )
-from app.models.session import Session, SessionStatus
+from app.models.exercise import BodyPart, Exercise, ExerciseCategory
+from app.models.session import Session, SessionExerciseResult, SessionStatus
 from app.models.user import User
 
 
@@ -549,6 +550,51 @@ class TestDeleteCurrentUserEndpoint:
         )
         assert result.scalar_one_or_none() is None
 
+    @pytest.mark.asyncio
+    async def test_delete_user_cascades_exercise_results(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        test_user: User,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Exercise results of every session are removed with the account."""
+        exercise = Exercise(
+            id=uuid4(),
+            name="Test Exercise",
+            category=ExerciseCategory.MOBILITY,
+            body_part=BodyPart.KNEE,
+        )
+        session.add(exercise)
+        for _ in range(3):
+            user_session = Session(
+                id=uuid4(),
+                patient_id=test_user.id,
+                scheduled_date=datetime.now(UTC),
+                status=SessionStatus.COMPLETED,
+            )
+            session.add(user_session)
+            session.add(
+                SessionExerciseResult(
+                    session_id=user_session.id,
+                    exercise_id=exercise.id,
+                    score=75.0,
+                )
+            )
+        await session.commit()
+
+        response = await client.delete(
+            "/api/v1/auth/me",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 204
+
+        from sqlmodel import select
+
+        result = await session.execute(select(SessionExerciseResult))
+        assert result.scalars().all() == []
+
 
 class TestExportUserDataEndpoint:
     """Tests for GET /api/v1/auth/me/export endpoint (GDPR Data Portability)."""
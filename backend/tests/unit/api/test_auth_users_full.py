@@ -55,6 +55,35 @@ class TestUserRegistration:
         assert data["role"] == "patient"
         assert "id" in data
 
+    @pytest.mark.asyncio
+    async def test_register_sends_verification_in_background(
+        self,
+        client: AsyncClient,
+    ) -> None:
+        """The verification email is dispatched as a background task."""
+        with (
+            patch(
+                "app.api.v1.endpoints.auth.send_verification_email",
+                new_callable=AsyncMock,
+            ) as mock_send,
+            patch("fastapi.BackgroundTasks.add_task") as mock_add_task,
+        ):
+            response = await client.post(
+                "/api/v1/auth/register",
+                json={
+                    "email": "background@example.com",
+                    "password": "securepassword123",
+                },
+            )
+
+        assert response.status_code == 201
+        mock_send.assert_not_awaited()
+        mock_add_task.assert_called_once()
+        func, email, token = mock_add_task.call_args.args
+        assert func is mock_send
+        assert email == "background@example.com"
+        assert token
+
     @pytest.mark.asyncio
     async def test_register_duplicate_email(
         self,
@@ -11,7 +11,9 @@ Test coverage:
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import create_access_token, hash_password
@@ -257,6 +259,35 @@ class TestListExercises:
         assert len(data) == 1
         assert data[0]["name"] == "Active Exercise"
 
+    async def test_list_exercises_uses_active_name_index(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        test_user: User,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """The listing query repeats the partial index predicate, so it is used."""
+        listed: list[tuple[str, tuple]] = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if "FROM exercises" in statement:
+                listed.append((statement, parameters))
+
+        connection = await session.connection()
+        event.listen(connection.sync_connection, "before_cursor_execute", _capture)
+        try:
+            response = await client.get("/api/v1/exercises", headers=auth_headers)
+        finally:
+            event.remove(connection.sync_connection, "before_cursor_execute", _capture)
+
+        assert response.status_code == 200
+        statement, parameters = listed[-1]
+        plan = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        details = " ".join(row[3] for row in plan)
+        assert "USING INDEX ix_exercises_active_name" in details
+
 
 class TestGetExercise:
     """Test GET /api/v1/exercises/{exercise_id} endpoint."""
@@ -311,7 +342,7 @@ class TestGetExercise:
 class TestCreateExercise:
     """Test POST /api/v1/exercises endpoint."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def admin_user(self, session: AsyncSession) -> User:
         """Create an admin user."""
         user = User(
@@ -421,7 +452,7 @@ class TestCreateExercise:
 class TestUpdateExercise:
     """Test PATCH /api/v1/exercises/{exercise_id} endpoint."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def admin_user(self, session: AsyncSession) -> User:
         """Create an admin user."""
         user = User(
@@ -517,7 +548,7 @@ class TestUpdateExercise:
 class TestDeleteExercise:
     """Test DELETE /api/v1/exercises/{exercise_id} endpoint."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def admin_user(self, session: AsyncSession) -> User:
         """Create an admin user."""
         user = User(
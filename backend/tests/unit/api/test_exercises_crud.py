@@ -13,6 +13,7 @@ Test coverage:
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,7 +29,7 @@ from app.models.user import User, UserRole
 class TestExerciseCRUD:
     """Full CRUD tests for exercises with proper authorization."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def admin_user(self, session: AsyncSession) -> User:
         """Create admin user for protected operations."""
         user = User(
@@ -50,7 +51,7 @@ class TestExerciseCRUD:
         token = create_access_token(admin_user.id)
         return {"Authorization": f"Bearer {token}"}
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def sample_exercise(self, session: AsyncSession) -> Exercise:
         """Create a sample exercise for testing."""
         exercise = Exercise(
@@ -273,7 +274,7 @@ class TestExerciseCRUD:
 class TestExerciseFiltering:
     """Tests for exercise filtering and pagination."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def exercises_dataset(self, session: AsyncSession) -> list[Exercise]:
         """Create diverse dataset for filtering tests."""
         exercises = [
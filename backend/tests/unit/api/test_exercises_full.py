@@ -13,6 +13,7 @@ Test coverage:
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,7 +22,7 @@ from app.models.exercise import BodyPart, Exercise, ExerciseCategory
 from app.models.user import User, UserRole
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def admin_user(session: AsyncSession) -> User:
     """Create an admin user for testing."""
     user = User(
@@ -45,7 +46,7 @@ def admin_headers(admin_user: User) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def sample_exercise(session: AsyncSession) -> Exercise:
     """Create a sample exercise for testing."""
     exercise = Exercise(
@@ -64,7 +65,7 @@ async def sample_exercise(session: AsyncSession) -> Exercise:
     return exercise
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def multiple_exercises(session: AsyncSession) -> list[Exercise]:
     """Create multiple exercises for filter testing."""
     exercises = [
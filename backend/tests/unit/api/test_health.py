@@ -67,3 +67,28 @@ class TestHealthCheck:
         assert response.status_code == 200
         # Should respond within 100ms
         assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_health_check_sets_request_id(
+        self,
+        client: AsyncClient,
+    ) -> None:
+        """Responses carry a generated or echoed X-Request-ID."""
+        generated = await client.get("/health")
+        echoed = await client.get("/health", headers={"X-Request-ID": "abc-123"})
+
+        assert len(generated.headers["X-Request-ID"]) == 16
+        assert echoed.headers["X-Request-ID"] == "abc-123"
+
+    @pytest.mark.asyncio
+    async def test_health_check_is_not_cached_and_stable(
+        self,
+        client: AsyncClient,
+    ) -> None:
+        """The prebuilt response is reused without leaking per-request headers."""
+        first = await client.get("/health", headers={"X-Request-ID": "first"})
+        second = await client.get("/health", headers={"X-Request-ID": "second"})
+
+        assert first.content == second.content == b'{"status":"healthy"}'
+        assert first.headers["Cache-Control"] == "no-store"
+        assert second.headers.get_list("X-Request-ID") == ["second"]
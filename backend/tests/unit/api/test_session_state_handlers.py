@@ -0,0 +1,145 @@
+"""
+Unit tests for session state handling, calling the endpoint handlers directly.
+
+These branches used to be covered through the full E2E HTTP stack; calling
+the handlers with the test database session checks the same state logic
+without routing, auth and serialization on every case.
+
+Test coverage:
+1. Completing a session that was never started
+2. Starting an already completed session
+3. Submitting a result for a non-existent exercise
+4. Pain level tracking across start and complete
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.endpoints.sessions import (
+    complete_session,
+    start_session,
+    submit_exercise_result,
+)
+from app.models.session import (
+    Session,
+    SessionComplete,
+    SessionExerciseResultCreate,
+    SessionStart,
+    SessionStatus,
+)
+from app.models.user import User
+
+
+async def _add_session(
+    session: AsyncSession,
+    user: User,
+    status: SessionStatus = SessionStatus.IN_PROGRESS,
+) -> Session:
+    exercise_session = Session(
+        id=uuid4(),
+        patient_id=user.id,
+        scheduled_date=datetime.now(UTC),
+        status=status,
+    )
+    session.add(exercise_session)
+    await session.commit()
+    return exercise_session
+
+
+class TestSessionStateTransitions:
+    """Tests for start/complete transitions."""
+
+    @pytest.mark.asyncio
+    async def test_complete_not_started_session(
+        self, session: AsyncSession, test_user: User
+    ) -> None:
+        """A session can be completed without being started; no duration."""
+        exercise_session = await _add_session(session, test_user)
+
+        completed = await complete_session(
+            exercise_session.id,
+            SessionComplete(pain_level_after=2),
+            session,
+            test_user,
+        )
+
+        assert completed.status == SessionStatus.COMPLETED
+        assert completed.duration_seconds is None
+
+    @pytest.mark.asyncio
+    async def test_start_completed_session_rejected(
+        self, session: AsyncSession, test_user: User
+    ) -> None:
+        """Starting a completed session raises 400."""
+        exercise_session = await _add_session(
+            session, test_user, SessionStatus.COMPLETED
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await start_session(
+                exercise_session.id,
+                SessionStart(pain_level_before=5),
+                session,
+                test_user,
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestExerciseResultValidation:
+    """Tests for result submission checks."""
+
+    @pytest.mark.asyncio
+    async def test_result_for_missing_exercise_rejected(
+        self, session: AsyncSession, test_user: User
+    ) -> None:
+        """Submitting a result for an unknown exercise raises 404."""
+        exercise_session = await _add_session(session, test_user)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await submit_exercise_result(
+                exercise_session.id,
+                SessionExerciseResultCreate(
+                    exercise_id=uuid4(),
+                    sets_completed=3,
+                    reps_completed=10,
+                    score=85.0,
+                ),
+                session,
+                test_user,
+            )
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert exc_info.value.detail == "Exercise not found"
+
+
+class TestPainTracking:
+    """Tests for pain levels recorded across a session."""
+
+    @pytest.mark.asyncio
+    async def test_pain_improvement_recorded(
+        self, session: AsyncSession, test_user: User
+    ) -> None:
+        """Pain before start and after completion are both kept."""
+        exercise_session = await _add_session(session, test_user)
+
+        await start_session(
+            exercise_session.id,
+            SessionStart(pain_level_before=7),
+            session,
+            test_user,
+        )
+        completed = await complete_session(
+            exercise_session.id,
+            SessionComplete(pain_level_after=3),
+            session,
+            test_user,
+        )
+
+        assert completed.pain_level_before == 7
+        assert completed.pain_level_after == 3
+        assert completed.duration_seconds is not None
@@ -16,7 +16,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import hash_password
 from app.models.exercise import BodyPart, Exercise, ExerciseCategory
-from app.models.session import Session, SessionExerciseResult, SessionStatus
+from app.models.session import (
+    Session,
+    SessionExerciseResult,
+    SessionRead,
+    SessionStatus,
+)
 from app.models.user import User
 
 
@@ -69,6 +74,35 @@ class TestListSessions:
         assert len(data) == 1
         assert data[0]["id"] == str(own_session.id)
 
+    async def test_list_sessions_matches_read_schema(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        test_user: User,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Rows encoded directly with orjson match the SessionRead JSON."""
+        completed = Session(
+            id=uuid4(),
+            patient_id=test_user.id,
+            scheduled_date=datetime(2026, 3, 1, 9, 0),
+            status=SessionStatus.COMPLETED,
+            started_at=datetime(2026, 3, 1, 9, 0, 5, 123456),
+            completed_at=datetime(2026, 3, 1, 9, 30),
+            duration_seconds=1795,
+            pain_level_before=4,
+            overall_score=87.5,
+            notes="felt good",
+        )
+        session.add(completed)
+        await session.commit()
+
+        response = await client.get("/api/v1/sessions", headers=auth_headers)
+
+        assert response.status_code == 200
+        expected = SessionRead.model_validate(completed).model_dump(mode="json")
+        assert response.json() == [expected]
+
     async def test_list_sessions_filter_by_status(
         self,
         client: AsyncClient,
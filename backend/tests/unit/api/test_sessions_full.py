@@ -13,6 +13,7 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,7 +23,7 @@ from app.models.session import Session, SessionStatus
 from app.models.user import User
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def other_user(session: AsyncSession) -> User:
     """Create another user for access control tests."""
     user = User(
@@ -45,7 +46,7 @@ def other_user_headers(other_user: User) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_session(session: AsyncSession, test_user: User) -> Session:
     """Create a test session."""
     sess = Session(
@@ -60,7 +61,7 @@ async def test_session(session: AsyncSession, test_user: User) -> Session:
     return sess
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def started_session(session: AsyncSession, test_user: User) -> Session:
     """Create a started session."""
     sess = Session(
@@ -77,7 +78,7 @@ async def started_session(session: AsyncSession, test_user: User) -> Session:
     return sess
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_exercise(session: AsyncSession) -> Exercise:
     """Create a test exercise."""
     exercise = Exercise(
@@ -14,6 +14,7 @@ Test coverage:
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,7 +23,7 @@ from app.models.exercise_video import ExerciseVideo
 from app.models.user import User
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_exercise(session: AsyncSession) -> Exercise:
     """Create a test exercise."""
     exercise = Exercise(
@@ -39,7 +40,7 @@ async def test_exercise(session: AsyncSession) -> Exercise:
     return exercise
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_videos(
     session: AsyncSession,
     test_exercise: Exercise,
@@ -116,11 +116,30 @@ class TestSettingsEnvironmentOverrides:
         assert "127.0.0.1" in settings.allowed_hosts
         assert "testserver" in settings.allowed_hosts
 
+    def test_allowed_hosts_includes_local_test_ip(self) -> None:
+        """LOCAL_TEST_IP is added to the frozen allowed hosts."""
+        with patch.dict(os.environ, {"LOCAL_TEST_IP": "192.168.1.50"}):
+            settings = Settings()  # type: ignore[call-arg]
+            assert "192.168.1.50" in settings.allowed_hosts
+            assert isinstance(settings.allowed_hosts, frozenset)
+
+    def test_allowed_hosts_in_model_dump(self) -> None:
+        """The cached hosts stay visible in the settings dump."""
+        settings = get_settings()
+        assert settings.model_dump()["allowed_hosts"] == settings.allowed_hosts
+
     def test_redis_url_default(self) -> None:
         """Redis URL has correct default."""
         settings = get_settings()
         assert settings.redis_url == "redis://localhost:6379/0"
 
+    def test_db_pool_defaults(self) -> None:
+        """Postgres pool settings have sane defaults."""
+        settings = get_settings()
+        assert settings.db_pool_size == 20
+        assert settings.db_max_overflow == 10
+        assert settings.db_pool_recycle_seconds > 0
+
 
 class TestSettingsCaching:
     """Tests for settings caching behavior."""
@@ -143,12 +162,6 @@ class TestSettingsCaching:
 class TestSettingsValidation:
     """Tests for settings validation."""
 
-    def test_upload_temp_dir_is_set(self) -> None:
-        """Upload temp directory is set."""
-        settings = get_settings()
-        assert settings.upload_temp_dir is not None
-        assert "orthosense_uploads" in settings.upload_temp_dir
-
     def test_frontend_url_is_set(self) -> None:
         """Frontend URL is set."""
         settings = get_settings()
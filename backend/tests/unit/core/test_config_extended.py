@@ -151,11 +151,11 @@ class TestCorsSettings:
         assert len(settings.cors_origins) > 0
 
     def test_has_allowed_hosts(self):
-        """Should have allowed hosts computed property."""
+        """Should have allowed hosts precomputed as a frozenset."""
         settings = Settings()
 
         assert hasattr(settings, "allowed_hosts")
-        assert isinstance(settings.allowed_hosts, list)
+        assert isinstance(settings.allowed_hosts, frozenset)
 
 
 class TestRateLimitSettings:
@@ -184,12 +184,6 @@ class TestUploadSettings:
 
         assert settings.max_upload_size_mb > 0
 
-    def test_has_upload_temp_dir(self):
-        """Should have upload temp directory."""
-        settings = Settings()
-
-        assert hasattr(settings, "upload_temp_dir")
-
 
 class TestEnvironmentLoading:
     """Test loading from environment variables."""
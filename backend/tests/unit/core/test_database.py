@@ -28,6 +28,18 @@ class TestDatabaseEngine:
         assert hasattr(engine, "begin")
         assert hasattr(engine, "dispose")
 
+    def test_json_columns_round_trip_big_ints(self) -> None:
+        """Client JSON with integers beyond 64 bits is stored and read back exactly."""
+        from app.models.session import Session
+
+        dialect = engine.sync_engine.dialect
+        column_type = Session.__table__.c.device_info.type.dialect_impl(dialect)
+        device_info = {"build": 2**70, "fps": 30}
+
+        stored = column_type.bind_processor(dialect)(device_info)
+
+        assert column_type.result_processor(dialect, None)(stored) == device_info
+
 
 class TestSessionFactory:
     """Tests for async session factory."""
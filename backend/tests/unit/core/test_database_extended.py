@@ -166,3 +166,16 @@ class TestSqliteConfiguration:
 
         assert hasattr(settings, "is_sqlite")
         assert isinstance(settings.is_sqlite, bool)
+
+    @pytest.mark.asyncio
+    async def test_sqlite_pragmas_applied_on_connect(self):
+        """New SQLite connections should get the tuning pragmas."""
+        from sqlalchemy import text
+
+        from app.core.database import engine
+
+        async with engine.connect() as conn:
+            synchronous = await conn.execute(text("PRAGMA synchronous"))
+            temp_store = await conn.execute(text("PRAGMA temp_store"))
+            assert synchronous.scalar() == 1  # NORMAL
+            assert temp_store.scalar() == 2  # MEMORY
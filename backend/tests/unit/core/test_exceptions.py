@@ -306,6 +306,25 @@ class TestGlobalExceptionHandler:
             body = json.loads(response.body.decode())
             assert "request_id" in body
 
+    @pytest.mark.asyncio
+    async def test_global_handler_prefers_middleware_request_id(self) -> None:
+        """Global handler reuses the request ID assigned by middleware."""
+        with patch("app.core.exceptions.settings") as mock_settings:
+            mock_settings.debug = False
+
+            request = MagicMock()
+            request.state.request_id = "0123456789abcdef"
+            request.headers = {"X-Request-ID": "ignored"}
+            request.url.path = "/api/test"
+            request.method = "GET"
+
+            response = await global_exception_handler(request, RuntimeError("x"))
+
+            import json
+
+            body = json.loads(response.body.decode())
+            assert body["request_id"] == "0123456789abcdef"
+
 
 class TestHttpExceptionHandler:
     """Tests for http_exception_handler function."""
@@ -0,0 +1,58 @@
+"""
+Unit tests for shared identifier helpers.
+
+Test coverage:
+1. uuid7 version and variant bits
+2. Embedded millisecond timestamp
+3. Ordering across milliseconds
+4. Model primary keys use uuid7
+"""
+
+import time
+from uuid import RFC_4122
+
+from app.core.ids import uuid7
+
+
+class TestUuid7:
+    """Tests for uuid7 helper."""
+
+    def test_version_and_variant(self) -> None:
+        """Generated IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == RFC_4122
+
+    def test_embeds_current_timestamp(self) -> None:
+        """The leading 48 bits hold the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_sorts_by_creation_time(self) -> None:
+        """IDs from later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+    def test_values_are_unique(self) -> None:
+        """Random bits keep IDs from the same millisecond distinct."""
+        assert len({uuid7() for _ in range(1000)}) == 1000
+
+    def test_models_use_uuid7(self) -> None:
+        """Primary keys of table models are time-ordered."""
+        from app.models.exercise import BodyPart, Exercise, ExerciseCategory
+        from app.models.user import User
+
+        user = User(email="ids@example.com", hashed_password="x")
+        exercise = Exercise(
+            name="Squat", category=ExerciseCategory.MOBILITY, body_part=BodyPart.KNEE
+        )
+
+        assert user.id.version == 7
+        assert exercise.id.version == 7
@@ -0,0 +1,94 @@
+"""
+Unit tests for column-only list helpers.
+
+Test coverage:
+1. Each list endpoint's column tuple matches its read schema
+2. Each list endpoint documents list[<read schema>] as response_model
+3. Unknown schema fields fail fast
+4. Rows are encoded as a JSON array
+"""
+
+from uuid import uuid4
+
+import orjson
+import pytest
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel, select
+
+from app.api.v1.endpoints import exercise_videos, exercises, sessions
+from app.core.listing import read_columns, rows_response
+from app.main import app
+from app.models.exercise import BodyPart, Exercise, ExerciseCategory, ExerciseRead
+from app.models.exercise_video import ExerciseVideoRead
+from app.models.session import SessionRead
+
+LIST_ENDPOINTS = [
+    (sessions.list_sessions, sessions._SESSION_READ_COLUMNS, SessionRead),
+    (exercises.list_exercises, exercises._EXERCISE_READ_COLUMNS, ExerciseRead),
+    (
+        exercise_videos.list_exercise_videos,
+        exercise_videos._VIDEO_READ_COLUMNS,
+        ExerciseVideoRead,
+    ),
+]
+
+
+class TestListEndpointSchemas:
+    """The raw-row responses must stay in the documented schema's shape."""
+
+    @pytest.mark.parametrize(("endpoint", "columns", "schema"), LIST_ENDPOINTS)
+    def test_columns_match_read_schema(self, endpoint, columns, schema) -> None:
+        """Selected column names are exactly the read schema's fields."""
+        assert [column.key for column in columns] == list(schema.model_fields)
+
+    @pytest.mark.parametrize(("endpoint", "columns", "schema"), LIST_ENDPOINTS)
+    def test_response_model_is_read_schema_list(
+        self, endpoint, columns, schema
+    ) -> None:
+        """The OpenAPI response model documents the same read schema."""
+        route = next(
+            route
+            for route in app.routes
+            if isinstance(route, APIRoute) and route.endpoint is endpoint
+        )
+        assert route.response_model == list[schema]
+
+
+class TestReadColumns:
+    """Tests for read_columns."""
+
+    def test_unknown_field_raises(self) -> None:
+        """A schema field missing on the table fails at definition time."""
+
+        class BrokenRead(SQLModel):
+            id: str
+            not_a_column: str
+
+        with pytest.raises(AttributeError):
+            read_columns(Exercise, BrokenRead)
+
+
+class TestRowsResponse:
+    """Tests for rows_response."""
+
+    @pytest.mark.asyncio
+    async def test_rows_encoded_as_json_array(self, session: AsyncSession) -> None:
+        """Each row becomes one JSON object keyed by column name."""
+        exercise = Exercise(
+            id=uuid4(),
+            name="Listing Squat",
+            category=ExerciseCategory.STRENGTH,
+            body_part=BodyPart.KNEE,
+        )
+        session.add(exercise)
+        await session.flush()
+
+        response = await rows_response(
+            session,
+            select(Exercise.id, Exercise.name).where(Exercise.id == exercise.id),
+        )
+
+        assert orjson.loads(response.body) == [
+            {"id": str(exercise.id), "name": "Listing Squat"}
+        ]
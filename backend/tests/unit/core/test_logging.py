@@ -162,6 +162,35 @@ class TestCloudWatchCompatibility:
                 # structlog may format with additional wrapper
                 assert "test_event" in output
 
+    def test_json_renderer_handles_non_native_values(self) -> None:
+        """The orjson serializer falls back to repr and accepts non-str keys."""
+        import json as json_module
+
+        from app.core.logging import _orjson_dumps
+
+        class Opaque:
+            def __repr__(self) -> str:
+                return "<opaque>"
+
+        output = _orjson_dumps({"event": "x", "obj": Opaque(), 1: "one"}, default=repr)
+
+        assert isinstance(output, str)
+        assert json_module.loads(output) == {
+            "event": "x",
+            "obj": "<opaque>",
+            "1": "one",
+        }
+
+    def test_json_renderer_handles_big_ints(self) -> None:
+        """Integers orjson cannot encode fall back to stdlib json."""
+        import json as json_module
+
+        from app.core.logging import _orjson_dumps
+
+        output = _orjson_dumps({"event": "x", "build": 2**70}, default=repr)
+
+        assert json_module.loads(output) == {"event": "x", "build": 2**70}
+
 
 class TestLogLevelParsing:
     """Tests for log level string parsing."""
@@ -0,0 +1,230 @@
+"""
+Unit tests for the pure ASGI security middleware.
+
+Test coverage:
+1. Security headers on responses
+2. Request ID assignment and propagation
+3. Global rate limiting responses
+4. Non-HTTP scopes pass through untouched
+5. Selective gzip compression
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from httpx import ASGITransport, AsyncClient
+
+from app.core.middleware import (
+    SecurityHeadersMiddleware,
+    SelectiveGZipMiddleware,
+)
+
+
+def _build_app() -> FastAPI:
+    """Create a minimal app wrapped in the security middleware."""
+    app = FastAPI()
+
+    @app.get("/echo-id")
+    async def echo_id(request: Request) -> dict[str, str]:
+        return {"request_id": request.state.request_id}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "healthy"}
+
+    @app.get("/own-headers")
+    async def own_headers() -> Response:
+        return Response(
+            headers={"X-Frame-Options": "SAMEORIGIN", "X-Request-ID": "route-set"}
+        )
+
+    app.add_middleware(SecurityHeadersMiddleware)
+    return app
+
+
+@pytest_asyncio.fixture
+async def client():
+    """HTTP client for the middleware test app."""
+    transport = ASGITransport(app=_build_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+class TestSecurityHeaders:
+    """Tests for static security headers."""
+
+    @pytest.mark.asyncio
+    async def test_security_headers_present(self, client: AsyncClient) -> None:
+        """Every response carries the hardening headers."""
+        response = await client.get("/echo-id")
+
+        assert response.headers["Strict-Transport-Security"] == (
+            "max-age=63072000; includeSubDomains; preload"
+        )
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["X-XSS-Protection"] == "1; mode=block"
+        assert response.headers["Referrer-Policy"] == (
+            "strict-origin-when-cross-origin"
+        )
+
+    @pytest.mark.asyncio
+    async def test_headers_added_to_not_found(self, client: AsyncClient) -> None:
+        """Error responses from the app also carry security headers."""
+        response = await client.get("/missing")
+
+        assert response.status_code == 404
+        assert response.headers["X-Frame-Options"] == "DENY"
+
+    @pytest.mark.asyncio
+    async def test_headers_added_once(self, client: AsyncClient) -> None:
+        """Pre-encoded headers are appended exactly once per response."""
+        response = await client.get("/echo-id")
+
+        assert response.headers.get_list("X-Frame-Options") == ["DENY"]
+        assert len(response.headers.get_list("X-Request-ID")) == 1
+
+    @pytest.mark.asyncio
+    async def test_route_headers_are_replaced(self, client: AsyncClient) -> None:
+        """Headers the route already set are overridden, not duplicated."""
+        response = await client.get("/own-headers")
+
+        assert response.headers.get_list("X-Frame-Options") == ["DENY"]
+        request_ids = response.headers.get_list("X-Request-ID")
+        assert len(request_ids) == 1
+        assert request_ids[0] != "route-set"
+
+
+class TestRequestId:
+    """Tests for request ID handling."""
+
+    @pytest.mark.asyncio
+    async def test_request_id_matches_state(self, client: AsyncClient) -> None:
+        """The response header matches the ID exposed on request.state."""
+        response = await client.get("/echo-id")
+
+        assert response.json()["request_id"] == response.headers["X-Request-ID"]
+        assert len(response.headers["X-Request-ID"]) == 16
+
+    @pytest.mark.asyncio
+    async def test_client_request_id_is_echoed(self, client: AsyncClient) -> None:
+        """A client-supplied X-Request-ID is reused."""
+        response = await client.get("/echo-id", headers={"X-Request-ID": "trace-1"})
+
+        assert response.json()["request_id"] == "trace-1"
+        assert response.headers["X-Request-ID"] == "trace-1"
+
+
+class TestGlobalRateLimit:
+    """Tests for the global rate limit check."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_returns_429(self, client: AsyncClient) -> None:
+        """An exceeded global limit yields a 429 with Retry-After."""
+        exc = HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded. Try again in 60 seconds.",
+            headers={"Retry-After": "60"},
+        )
+        with (
+            patch("app.core.middleware.settings") as mock_settings,
+            patch(
+                "app.core.middleware.api_limiter.check",
+                new_callable=AsyncMock,
+                side_effect=exc,
+            ),
+        ):
+            mock_settings.rate_limit_enabled = True
+            response = await client.get("/echo-id")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "60"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "Rate limit exceeded" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_health_skips_rate_limit(self, client: AsyncClient) -> None:
+        """Health checks are never rate limited."""
+        with (
+            patch("app.core.middleware.settings") as mock_settings,
+            patch(
+                "app.core.middleware.api_limiter.check", new_callable=AsyncMock
+            ) as mock_check,
+        ):
+            mock_settings.rate_limit_enabled = True
+            response = await client.get("/health")
+
+        assert response.status_code == 200
+        mock_check.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_flag_read_at_construction(self) -> None:
+        """The enabled flag is captured when the middleware is built."""
+        with patch("app.core.middleware.settings") as mock_settings:
+            mock_settings.rate_limit_enabled = False
+            middleware = SecurityHeadersMiddleware(AsyncMock())
+            mock_settings.rate_limit_enabled = True
+
+        assert middleware.rate_limit_enabled is False
+
+
+class TestNonHttpScopes:
+    """Tests for non-HTTP ASGI scopes."""
+
+    @pytest.mark.asyncio
+    async def test_lifespan_scope_passes_through(self) -> None:
+        """Non-HTTP scopes are forwarded without modification."""
+        inner = AsyncMock()
+        middleware = SecurityHeadersMiddleware(inner)
+        scope = {"type": "lifespan"}
+        receive = AsyncMock()
+        send = AsyncMock()
+
+        await middleware(scope, receive, send)
+
+        inner.assert_awaited_once_with(scope, receive, send)
+
+
+class TestSelectiveGZip:
+    """Tests for SelectiveGZipMiddleware."""
+
+    @staticmethod
+    def _gzip_app() -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/big")
+        async def big() -> dict[str, str]:
+            return {"data": "x" * 2000}
+
+        @app.get("/health")
+        async def health() -> dict[str, str]:
+            return {"padding": "x" * 2000}
+
+        app.add_middleware(
+            SelectiveGZipMiddleware,
+            exclude_paths=frozenset({"/health"}),
+            minimum_size=1000,
+            compresslevel=5,
+        )
+        return app
+
+    @pytest.mark.asyncio
+    async def test_large_response_is_compressed(self) -> None:
+        """Responses above minimum_size are gzip encoded."""
+        transport = ASGITransport(app=self._gzip_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            response = await ac.get("/big", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json()["data"] == "x" * 2000
+
+    @pytest.mark.asyncio
+    async def test_excluded_path_is_not_compressed(self) -> None:
+        """Excluded paths bypass gzip regardless of size."""
+        transport = ASGITransport(app=self._gzip_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            response = await ac.get("/health", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
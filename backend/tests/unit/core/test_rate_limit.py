@@ -12,11 +12,15 @@ Test coverage:
 8. Redis connection handling
 """
 
+import asyncio
+import time
+from collections import deque
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException, Request
+from starlette.datastructures import State
 
 from app.core.rate_limit import (
     RateLimiter,
@@ -24,11 +28,18 @@ from app.core.rate_limit import (
     api_limiter,
     auth_limiter,
     auth_strict_limiter,
+    get_redis_client,
     rate_limit,
     strict_limiter,
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_redis_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test without a pending Redis reconnect backoff."""
+    monkeypatch.setattr("app.core.rate_limit._redis_retry_at", 0.0)
+
+
 class TestRateLimiterInit:
     """Tests for RateLimiter initialization."""
 
@@ -47,11 +58,13 @@ class TestRateLimiterInit:
 
         assert limiter.use_redis is False
 
-    def test_init_redis_client_is_none(self) -> None:
-        """RateLimiter initializes with None Redis client."""
-        limiter = RateLimiter(requests=10, window_seconds=60)
+    def test_init_does_not_connect_to_redis(self) -> None:
+        """Creating a RateLimiter does not create a Redis client."""
+        from app.core import rate_limit as rate_limit_module
 
-        assert limiter._redis_client is None
+        RateLimiter(requests=10, window_seconds=60)
+
+        assert rate_limit_module._redis_client is None
 
 
 class TestClientKeyGeneration:
@@ -119,6 +132,22 @@ class TestClientKeyGeneration:
         assert key2 == "rate_limit:register:192.168.1.1"
         assert key1 != key2
 
+    def test_get_client_key_caches_ip_on_request_state(self) -> None:
+        """Client IP is resolved once and reused from request.state."""
+        limiter = RateLimiter(requests=10, window_seconds=60)
+        request = MagicMock(spec=Request)
+        request.state = State()
+        request.headers = MagicMock()
+        request.headers.get.return_value = "10.0.0.1, 192.168.1.1"
+
+        key1 = limiter._get_client_key(request, "login")
+        key2 = limiter._get_client_key(request, "api")
+
+        assert request.state.client_ip == "10.0.0.1"
+        assert key1 == "rate_limit:login:10.0.0.1"
+        assert key2 == "rate_limit:api:10.0.0.1"
+        request.headers.get.assert_called_once_with("X-Forwarded-For")
+
 
 class TestMemoryRateLimiting:
     """Tests for in-memory rate limiting fallback."""
@@ -376,7 +405,9 @@ class TestRedisRateLimiting:
 
         # Mock _get_redis to return a mock that raises exception
         mock_redis = MagicMock()
-        mock_redis.pipeline.side_effect = RuntimeError("Redis error")
+        mock_redis.register_script.return_value = AsyncMock(
+            side_effect=RuntimeError("Redis error")
+        )
 
         with patch.object(limiter, "_get_redis", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_redis
@@ -386,6 +417,137 @@ class TestRedisRateLimiting:
             # Should fall back to memory and succeed
             assert allowed is True
 
+    @pytest.mark.asyncio
+    async def test_limiters_share_one_redis_client(self) -> None:
+        """All limiters reuse a single Redis client and connect only once."""
+        from app.core import rate_limit as rate_limit_module
+
+        mock_client = AsyncMock()
+        redis_asyncio = MagicMock()
+        redis_asyncio.from_url.return_value = mock_client
+        redis_module = MagicMock(asyncio=redis_asyncio)
+        with (
+            patch("app.core.rate_limit.settings") as mock_settings,
+            patch.dict(
+                "sys.modules", {"redis": redis_module, "redis.asyncio": redis_asyncio}
+            ),
+        ):
+            mock_settings.rate_limit_enabled = True
+
+            first = RateLimiter(requests=10, window_seconds=60, use_redis=True)
+            second = RateLimiter(requests=5, window_seconds=30, use_redis=True)
+            try:
+                assert await first._get_redis() is mock_client
+                assert await second._get_redis() is mock_client
+                redis_asyncio.from_url.assert_called_once()
+                mock_client.ping.assert_awaited_once()
+            finally:
+                await rate_limit_module.close_redis_client()
+
+        mock_client.aclose.assert_awaited_once()
+        assert rate_limit_module._redis_client is None
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_backs_off(self) -> None:
+        """After a failed connect, Redis is not retried until the backoff ends."""
+        from app.core import rate_limit as rate_limit_module
+
+        failing_client = AsyncMock()
+        failing_client.ping.side_effect = ConnectionError("down")
+        redis_asyncio = MagicMock()
+        redis_asyncio.from_url.return_value = failing_client
+        redis_module = MagicMock(asyncio=redis_asyncio)
+        with patch.dict(
+            "sys.modules", {"redis": redis_module, "redis.asyncio": redis_asyncio}
+        ):
+            assert await get_redis_client() is None
+            assert await get_redis_client() is None
+            redis_asyncio.from_url.assert_called_once()
+
+            retry_at = rate_limit_module._redis_retry_at
+            with patch("app.core.rate_limit.monotonic", return_value=retry_at + 1):
+                assert await get_redis_client() is None
+            assert redis_asyncio.from_url.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_callers_do_not_wait_on_pending_connect(self) -> None:
+        """While one connect is in flight, other callers fall back immediately."""
+        from app.core import rate_limit as rate_limit_module
+
+        ping_started = asyncio.Event()
+        release_ping = asyncio.Event()
+
+        async def slow_ping() -> bool:
+            ping_started.set()
+            await release_ping.wait()
+            return True
+
+        mock_client = AsyncMock()
+        mock_client.ping.side_effect = slow_ping
+        redis_asyncio = MagicMock()
+        redis_asyncio.from_url.return_value = mock_client
+        redis_module = MagicMock(asyncio=redis_asyncio)
+        with patch.dict(
+            "sys.modules", {"redis": redis_module, "redis.asyncio": redis_asyncio}
+        ):
+            connecting = asyncio.create_task(get_redis_client())
+            await ping_started.wait()
+            try:
+                assert await get_redis_client() is None
+                release_ping.set()
+                assert await connecting is mock_client
+                redis_asyncio.from_url.assert_called_once()
+            finally:
+                await rate_limit_module.close_redis_client()
+
+    @pytest.mark.asyncio
+    async def test_check_redis_uses_single_script_call(self) -> None:
+        """_check_redis evaluates the sliding window in one script call."""
+        limiter = RateLimiter(requests=10, window_seconds=60, use_redis=True)
+        script = AsyncMock(return_value=[1, 7])
+        mock_redis = MagicMock()
+        mock_redis.register_script.return_value = script
+
+        with patch.object(limiter, "_get_redis", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_redis
+
+            assert await limiter._check_redis("k") == (True, 7)
+            script.return_value = [0, 0]
+            assert await limiter._check_redis("k") == (False, 0)
+
+        mock_redis.register_script.assert_called_once()
+        assert script.await_count == 2
+        assert script.await_args.kwargs["keys"] == ["k"]
+
+    @pytest.mark.asyncio
+    async def test_script_uses_client_after_reconnect(self) -> None:
+        """After close_redis_client() and a reconnect, calls use the new client."""
+        from app.core import rate_limit as rate_limit_module
+
+        script = AsyncMock(return_value=[1, 9])
+        old_client, new_client = AsyncMock(), AsyncMock()
+        old_client.register_script = MagicMock(return_value=script)
+        redis_asyncio = MagicMock()
+        redis_asyncio.from_url.side_effect = [old_client, new_client]
+        redis_module = MagicMock(asyncio=redis_asyncio)
+        with (
+            patch("app.core.rate_limit.settings") as mock_settings,
+            patch.dict(
+                "sys.modules", {"redis": redis_module, "redis.asyncio": redis_asyncio}
+            ),
+        ):
+            mock_settings.rate_limit_enabled = True
+            limiter = RateLimiter(requests=10, window_seconds=60, use_redis=True)
+            try:
+                await limiter._check_redis("k")
+                assert script.await_args.kwargs["client"] is old_client
+
+                await rate_limit_module.close_redis_client()
+                await limiter._check_redis("k")
+                assert script.await_args.kwargs["client"] is new_client
+            finally:
+                await rate_limit_module.close_redis_client()
+
 
 class TestAuthStrictLimiter:
     """Tests for auth_strict_limiter configuration."""
@@ -435,8 +597,8 @@ class TestMemoryStoreCleanup:
 
         # Add some old entries manually
 
-        old_time = datetime.now().timestamp() - 10  # 10 seconds ago
-        _memory_store[key] = [old_time, old_time + 0.1, old_time + 0.2]
+        old_time = time.monotonic() - 10  # 10 seconds ago
+        _memory_store[key] = deque([old_time, old_time + 0.1, old_time + 0.2])
 
         # Now check - old entries should be cleaned
         allowed, remaining = limiter._check_memory_sync(key)
@@ -444,3 +606,17 @@ class TestMemoryStoreCleanup:
         assert allowed is True
         # Old entries should be removed, only new entry remains
         assert len(_memory_store[key]) == 1
+
+    def test_memory_store_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Least recently used keys are evicted once the store is full."""
+        monkeypatch.setattr("app.core.rate_limit._MEMORY_STORE_MAX_KEYS", 2)
+        limiter = RateLimiter(requests=10, window_seconds=60, use_redis=False)
+        _memory_store.clear()
+
+        limiter._check_memory_sync("bounded_a")
+        limiter._check_memory_sync("bounded_b")
+        limiter._check_memory_sync("bounded_a")
+        limiter._check_memory_sync("bounded_c")
+
+        assert list(_memory_store) == ["bounded_a", "bounded_c"]
+        _memory_store.clear()
@@ -166,6 +166,16 @@ class TestSanitizeString:
         assert "Hello" in result
         assert "World" in result
 
+    def test_long_string_matches_cached_path(self):
+        """Long strings bypass the cache but are escaped identically."""
+        from app.core.sanitizer import _SANITIZE_CACHE_MAX_LEN
+
+        short = "<a>\x00&"
+        long_value = short * (_SANITIZE_CACHE_MAX_LEN // len(short) + 1)
+        assert sanitize_string(long_value) == sanitize_string(short) * (
+            _SANITIZE_CACHE_MAX_LEN // len(short) + 1
+        )
+
     def test_handles_unicode(self):
         """Should handle unicode characters."""
         text = "日本語テスト 🎉"
@@ -255,3 +265,60 @@ class TestXssPatterns:
         """Should detect link tags."""
         malicious = '<link rel="stylesheet" href="evil.css">'
         assert contains_xss(malicious) is True
+
+    def test_combined_pattern_matches_individual_patterns(self):
+        """Combined alternation should agree with the per-pattern scan."""
+        from app.core.sanitizer import _XSS_COMBINED, XSS_PATTERNS
+
+        samples = [
+            "<script>alert(1)</script>",
+            "<SCRIPT\n>x</SCRIPT>",
+            "onmouseover = x",
+            "JavaScript:void(0)",
+            "data:text/html",
+            "eval (x)",
+            "<b>bold</b>",
+            "plain text",
+            "5 < 6 and 7 > 3",
+            "salon = beauty",
+            "<a<>",
+            "<<>",
+            "<>",
+            "a <<< b >",
+        ]
+        for sample in samples:
+            expected = any(p.search(sample) for p in XSS_PATTERNS)
+            assert (_XSS_COMBINED.search(sample) is not None) is expected
+
+    def test_unclosed_angle_brackets_scan_linearly(self):
+        """Many unclosed '<' must not rescan the rest of the input per '<'."""
+        import time
+
+        pathological = "<" * 50_000
+        start = time.perf_counter()
+        assert contains_xss(pathological) is False
+        assert time.perf_counter() - start < 0.5
+
+    def test_prefilter_keeps_handler_without_tag(self):
+        """Event handlers without angle brackets must survive the prefilter."""
+        assert contains_xss("x onfocus=alert`1`") is True
+        assert contains_xss("&#60;b&#62;") is True
+        assert contains_xss("Physiotherapy session notes") is False
+
+    def test_short_values_are_cached(self):
+        """Repeated short values should hit the LRU cache."""
+        from app.core.sanitizer import _scan_xss_cached
+
+        _scan_xss_cached.cache_clear()
+        assert contains_xss("<b>repeat</b>") is True
+        assert contains_xss("<b>repeat</b>") is True
+        assert _scan_xss_cached.cache_info().hits == 1
+
+    def test_long_values_bypass_cache(self):
+        """Values above the cache length limit are scanned directly."""
+        from app.core.sanitizer import _XSS_CACHE_MAX_LEN, _scan_xss_cached
+
+        _scan_xss_cached.cache_clear()
+        long_value = "a" * _XSS_CACHE_MAX_LEN + "<script>"
+        assert contains_xss(long_value) is True
+        assert _scan_xss_cached.cache_info().currsize == 0
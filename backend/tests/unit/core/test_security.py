@@ -7,8 +7,11 @@ Test coverage:
 3. Token decoding and validation
 4. Token expiration handling
 5. Edge cases and security scenarios
+6. Verified-token cache
 """
 
+import hashlib
+import hmac
 import time
 from datetime import timedelta
 from uuid import uuid4
@@ -18,13 +21,17 @@ import pytest
 
 from app.core.config import settings
 from app.core.security import (
+    _token_cache,
+    clear_token_cache,
     create_access_token,
     create_password_reset_token,
     create_token,
     create_verification_token,
     decode_token,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     verify_token,
 )
 
@@ -101,6 +108,16 @@ class TestPasswordHashing:
 
         assert verify_password(password, hashed) is True
 
+    @pytest.mark.asyncio
+    async def test_async_helpers_run_bcrypt_off_loop(self) -> None:
+        """Async hashing helpers round-trip with the sync helpers."""
+        password = "SecurePassword123!"
+        hashed = await hash_password_async(password)
+
+        assert verify_password(password, hashed) is True
+        assert await verify_password_async(password, hashed) is True
+        assert await verify_password_async("WrongPassword123!", hashed) is False
+
 
 class TestTokenCreation:
     """Tests for JWT token creation functions."""
@@ -363,3 +380,120 @@ class TestSecurityEdgeCases:
         # Verification should fail
         decoded = decode_token(tampered_token)
         assert decoded is None
+
+
+class TestHS256FastPath:
+    """Tests for the hmac-based HS256 decode path."""
+
+    def test_fast_path_skips_pyjwt(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Plain HS256 tokens are verified without calling jwt.decode."""
+        token = create_access_token(uuid4())
+
+        def fail_decode(*_args, **_kwargs) -> None:
+            raise AssertionError("jwt.decode should not be called")
+
+        monkeypatch.setattr("app.core.security.jwt.decode", fail_decode)
+        decoded = decode_token(token)
+
+        assert decoded is not None
+        assert decoded["type"] == "access"
+
+    def test_fast_path_matches_pyjwt_payload(self) -> None:
+        """Fast path returns the same payload as PyJWT."""
+        token = create_token(uuid4(), "access", extra_claims={"role": "patient"})
+
+        expected = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+        assert decode_token(token) == expected
+
+    def test_unverified_claims_fall_back_to_pyjwt(self) -> None:
+        """Tokens with claims such as nbf are validated by PyJWT."""
+        payload = {
+            "sub": str(uuid4()),
+            "type": "access",
+            "exp": time.time() + 3600,
+            "nbf": time.time() + 3600,
+        }
+        token = jwt.encode(payload, settings.secret_key, algorithm="HS256")
+
+        assert decode_token(token) is None
+
+    def test_non_json_segments_rejected(self) -> None:
+        """Segments that are not base64url JSON return None."""
+        token = create_access_token(uuid4())
+        header, _payload, signature = token.split(".")
+
+        assert decode_token(f"{header}.bm90LWpzb24.{signature}") is None
+        assert decode_token(f"{header}.!!!.{signature}") is None
+
+    def test_hmac_key_state_is_reused(self) -> None:
+        """The keyed HMAC template is built once per secret and never mutated."""
+        from app.core.security import _hmac_template
+
+        _hmac_template.cache_clear()
+        first = create_access_token(uuid4())
+        second = create_access_token(uuid4())
+
+        assert decode_token(first) is not None
+        assert decode_token(second) is not None
+        assert _hmac_template.cache_info().misses == 1
+        # Template still holds only the key, no message bytes
+        untouched = hmac.new(settings.secret_key.encode(), digestmod=hashlib.sha256)
+        assert _hmac_template(settings.secret_key).digest() == untouched.digest()
+
+    def test_non_numeric_exp_rejected(self) -> None:
+        """A non-numeric exp claim is rejected."""
+        payload = {"sub": str(uuid4()), "type": "access", "exp": "soon"}
+        token = jwt.encode(payload, settings.secret_key, algorithm="HS256")
+
+        assert decode_token(token) is None
+
+
+class TestTokenCache:
+    """Tests for the opt-in verified-token cache."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch: pytest.MonkeyPatch):
+        """Enable the cache for each test and start from an empty cache."""
+        monkeypatch.setattr(settings, "token_cache_enabled", True)
+        clear_token_cache()
+        yield
+        clear_token_cache()
+
+    def test_second_verification_skips_decode(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A cached token is verified without decoding again."""
+        user_id = str(uuid4())
+        token = create_access_token(user_id)
+        assert verify_token(token, "access") == user_id
+
+        def fail_decode(_token: str) -> None:
+            raise AssertionError("decode_token should not be called")
+
+        monkeypatch.setattr("app.core.security.decode_token", fail_decode)
+        assert verify_token(token, "access") == user_id
+
+    def test_cached_token_still_checks_type(self) -> None:
+        """Cache hits still enforce the expected token type."""
+        token = create_access_token(str(uuid4()))
+        assert verify_token(token, "access") is not None
+        assert verify_token(token, "reset") is None
+
+    def test_invalid_tokens_are_not_cached(self) -> None:
+        """Failed verifications are never stored."""
+        assert verify_token("not-a-jwt", "access") is None
+        assert len(_token_cache) == 0
+
+    def test_entry_does_not_outlive_token(self) -> None:
+        """Cached entries expire with the token itself."""
+        token = create_token(str(uuid4()), "access", timedelta(seconds=1))
+        assert verify_token(token, "access") is not None
+        time.sleep(1.1)
+        assert verify_token(token, "access") is None
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Oldest entries are evicted beyond the configured size."""
+        monkeypatch.setattr(settings, "token_cache_max_size", 2)
+        for _ in range(3):
+            verify_token(create_access_token(str(uuid4())), "access")
+        assert len(_token_cache) == 2
@@ -0,0 +1,34 @@
+"""
+Unit tests for shared time helpers.
+
+Test coverage:
+1. utc_now returns naive UTC datetimes
+2. Model modules share the same helper
+"""
+
+from datetime import UTC, datetime
+
+from app.core.time import utc_now
+
+
+class TestUtcNow:
+    """Tests for utc_now helper."""
+
+    def test_returns_naive_datetime(self) -> None:
+        """utc_now strips tzinfo for TIMESTAMP WITHOUT TIME ZONE columns."""
+        assert utc_now().tzinfo is None
+
+    def test_returns_current_utc_time(self) -> None:
+        """utc_now is the current UTC wall-clock time."""
+        before = datetime.now(UTC).replace(tzinfo=None)
+        result = utc_now()
+        after = datetime.now(UTC).replace(tzinfo=None)
+
+        assert before <= result <= after
+
+    def test_models_share_helper(self) -> None:
+        """All model modules use the single shared implementation."""
+        from app.models import exercise, exercise_video, protocol, session, user
+
+        for module in (exercise, exercise_video, protocol, session, user):
+            assert module.utc_now is utc_now
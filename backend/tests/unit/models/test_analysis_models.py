@@ -64,6 +64,17 @@ class TestVideoAnalysisResponse:
         assert response.status == AnalysisStatus.PENDING
         assert response.message == "Analysis started"
 
+    def test_string_status_is_coerced_to_enum(self) -> None:
+        """Status given as a plain string is exposed as an AnalysisStatus."""
+        response = VideoAnalysisResponse(
+            task_id="task-123",
+            session_id="session-456",
+            status="processing",
+            message="Analysis started",
+        )
+
+        assert response.status is AnalysisStatus.PROCESSING
+
     def test_created_at_default_value(self) -> None:
         """Created at defaults to current time."""
         before = datetime.utcnow()
@@ -232,6 +243,21 @@ class TestAnalysisError:
 
         assert error.session_id == "session-789"
 
+    def test_analysis_error_is_immutable(self) -> None:
+        """AnalysisError instances are frozen and hashable."""
+        error = AnalysisError(error="server_error", detail="Internal error")
+
+        with pytest.raises(ValidationError):
+            error.detail = "changed"
+        assert hash(error) == hash(
+            AnalysisError(error="server_error", detail="Internal error")
+        )
+
+    def test_analysis_error_rejects_unknown_fields(self) -> None:
+        """Unknown fields are rejected instead of silently ignored."""
+        with pytest.raises(ValidationError):
+            AnalysisError(error="server_error", detail="x", trace="secret")
+
 
 class TestTaskStatusResponse:
     """Tests for TaskStatusResponse model."""
@@ -7,6 +7,7 @@ Test coverage:
 3. ProtocolExercise association model
 4. Field constraints (duration_weeks, sets, reps, etc.)
 5. Timestamp auto-generation
+6. Foreign key indexes
 """
 
 from datetime import UTC, datetime
@@ -183,6 +184,19 @@ class TestProtocolExerciseModel:
         assert pe.hold_seconds == 30
         assert pe.rest_seconds == 60
 
+    def test_foreign_key_indexes(self) -> None:
+        """Both foreign keys are covered by an index for join lookups."""
+        indexes = {
+            index.name: [column.name for column in index.columns]
+            for index in ProtocolExercise.__table__.indexes
+        }
+
+        assert indexes["ix_protocol_exercises_protocol_order"] == [
+            "protocol_id",
+            "order",
+        ]
+        assert indexes["ix_protocol_exercises_exercise"] == ["exercise_id"]
+
 
 class TestProtocolExerciseBaseSchema:
     """Tests for ProtocolExerciseBase schema validation."""
@@ -11,6 +11,12 @@ Test coverage:
 from datetime import datetime
 from uuid import UUID, uuid4
 
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models.exercise import BodyPart, Exercise, ExerciseCategory
 from app.models.protocol import (
     Protocol,
     ProtocolBase,
@@ -267,3 +273,44 @@ class TestProtocolRelationships:
     def test_protocol_exercise_has_exercise_relationship(self):
         """ProtocolExercise should have relationship to exercise."""
         assert hasattr(ProtocolExercise, "exercise")
+
+    @pytest.mark.asyncio
+    async def test_protocol_loads_exercises_in_batches(self, session: AsyncSession):
+        """Loading a protocol eagerly loads its exercises in 3 queries total."""
+        protocol = Protocol(name="Knee Rehab")
+        exercises = [
+            Exercise(
+                name=f"Exercise {i}",
+                category=ExerciseCategory.MOBILITY,
+                body_part=BodyPart.KNEE,
+            )
+            for i in range(4)
+        ]
+        session.add(protocol)
+        session.add_all(exercises)
+        session.add_all(
+            ProtocolExercise(protocol_id=protocol.id, exercise_id=e.id, order=i)
+            for i, e in enumerate(exercises)
+        )
+        await session.commit()
+        session.expunge_all()
+
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        sync_engine = session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            result = await session.execute(
+                select(Protocol).where(Protocol.id == protocol.id)
+            )
+            loaded = result.scalar_one()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+
+        names = sorted(pe.exercise.name for pe in loaded.protocol_exercises)
+        assert names == [f"Exercise {i}" for i in range(4)]
+        assert len(statements) == 3
@@ -9,6 +9,7 @@ Test coverage:
 5. SessionExerciseResult model
 6. SessionSummary schema
 7. Field validation (pain levels, scores)
+8. Indexes and column types
 """
 
 from datetime import UTC, datetime
@@ -122,6 +123,38 @@ class TestSessionModel:
 
         assert session.created_at is not None
 
+    def test_patient_completed_index(self) -> None:
+        """Per-patient completion history is served by a composite index."""
+        indexes = {index.name: index for index in Session.__table__.indexes}
+
+        index = indexes["ix_sessions_patient_completed"]
+        assert [column.name for column in index.columns] == [
+            "patient_id",
+            "completed_at",
+        ]
+        assert "ix_sessions_completed_at" not in indexes
+
+    def test_in_progress_partial_index(self) -> None:
+        """In-progress sessions get a partial index keyed by stored enum name."""
+        indexes = {index.name: index for index in Session.__table__.indexes}
+
+        index = indexes["ix_sessions_in_progress"]
+        assert [column.name for column in index.columns] == [
+            "patient_id",
+            "scheduled_date",
+        ]
+        where = str(index.dialect_options["postgresql"]["where"])
+        assert where == f"status = '{SessionStatus.IN_PROGRESS.name}'"
+
+    def test_device_info_uses_jsonb_on_postgres(self) -> None:
+        """device_info is JSONB on PostgreSQL and plain JSON on SQLite."""
+        from sqlalchemy.dialects import postgresql, sqlite
+
+        column_type = Session.__table__.c.device_info.type
+
+        assert column_type.compile(dialect=postgresql.dialect()) == "JSONB"
+        assert column_type.compile(dialect=sqlite.dialect()) == "JSON"
+
 
 class TestSessionBaseSchema:
     """Tests for SessionBase schema validation."""
@@ -14,6 +14,7 @@ from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -101,7 +102,7 @@ class TestExerciseCreate:
 class TestExerciseRead:
     """Tests for reading/querying exercises."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def sample_exercises(self, session: AsyncSession) -> list[Exercise]:
         """Create sample exercises for testing."""
         exercises = [
@@ -258,7 +259,7 @@ class TestExerciseRead:
 class TestExercisePagination:
     """Tests for pagination and ordering."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def many_exercises(self, session: AsyncSession) -> list[Exercise]:
         """Create many exercises for pagination tests."""
         exercises = [
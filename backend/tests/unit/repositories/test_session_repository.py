@@ -16,6 +16,7 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
@@ -33,7 +34,7 @@ from app.models.user import User
 class TestSessionCreate:
     """Tests for session creation at repository level."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def patient_user(self, session: AsyncSession) -> User:
         """Create a patient user for sessions."""
         user = User(
@@ -105,7 +106,7 @@ class TestSessionCreate:
 class TestSessionQueries:
     """Tests for session query operations."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def patient_with_sessions(
         self,
         session: AsyncSession,
@@ -225,7 +226,7 @@ class TestSessionQueries:
 class TestSessionPagination:
     """Tests for session pagination."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def user_with_many_sessions(
         self,
         session: AsyncSession,
@@ -303,7 +304,7 @@ class TestSessionPagination:
 class TestSessionExerciseResults:
     """Tests for session-exercise result relationships."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def session_with_exercises(
         self,
         session: AsyncSession,
@@ -431,7 +432,7 @@ class TestSessionExerciseResults:
 class TestSessionLifecycle:
     """Tests for session state transitions."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def patient_session(
         self,
         session: AsyncSession,
@@ -542,7 +543,7 @@ class TestSessionLifecycle:
 class TestSessionDeviceInfo:
     """Tests for device info metadata."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def session_for_device(
         self,
         session: AsyncSession,
@@ -698,7 +699,7 @@ class TestSessionCascadeDeletes:
 class TestSessionEdgeCases:
     """Edge case tests for sessions."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def edge_case_user(self, session: AsyncSession) -> User:
         """Create user for edge case tests."""
         user = User(
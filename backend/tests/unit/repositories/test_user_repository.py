@@ -13,6 +13,7 @@ Test coverage:
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -127,7 +128,7 @@ class TestUserRepository:
 class TestUserQueryOperations:
     """Tests for complex query operations."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def multiple_users(self, session: AsyncSession) -> list[User]:
         """Create multiple users for query testing."""
         users = [
@@ -8,15 +8,24 @@ Test coverage:
 4. send_welcome_email
 5. Error handling scenarios
 6. API key and configuration scenarios
+7. Shared HTTP client lifecycle
+8. Concurrent bulk sends
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 
 from app.services.email import (
+    _auth_headers,
+    _from_field,
     _send_email,
+    check_email_config,
+    close_http_client,
+    get_http_client,
     send_password_reset_email,
     send_verification_email,
     send_welcome_email,
@@ -81,14 +90,13 @@ class TestSendEmailInternal:
 
             mock_response = MagicMock()
             mock_response.status_code = 200
+            mock_response.is_success = True
             mock_response.json.return_value = {"id": "msg_123"}
 
-            with patch("httpx.AsyncClient") as mock_client_class:
+            with patch("app.services.email.get_http_client") as mock_get_client:
                 mock_client = AsyncMock()
                 mock_client.post.return_value = mock_response
-                mock_client.__aenter__.return_value = mock_client
-                mock_client.__aexit__.return_value = None
-                mock_client_class.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 result = await _send_email(
                     "recipient@example.com",
@@ -99,6 +107,64 @@ class TestSendEmailInternal:
                 assert result is True
                 mock_client.post.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_send_email_posts_orjson_body(self) -> None:
+        """The payload is pre-serialized with orjson and sent as content."""
+        with patch("app.services.email.settings") as mock_settings:
+            mock_settings.email_enabled = True
+            mock_settings.resend_api_key = "re_test_api_key"
+            mock_settings.resend_from_name = "OrthoSense"
+            mock_settings.resend_from_email = "noreply@orthosense.com"
+
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.is_success = True
+            mock_response.json.return_value = {"id": "msg_123"}
+
+            with patch("app.services.email.get_http_client") as mock_get_client:
+                mock_client = AsyncMock()
+                mock_client.post.return_value = mock_response
+                mock_get_client.return_value = mock_client
+
+                await _send_email("a@example.com", "Hi", "<p>Zażółć</p>")
+
+        kwargs = mock_client.post.call_args.kwargs
+        assert "json" not in kwargs
+        assert orjson.loads(kwargs["content"]) == {
+            "from": "OrthoSense <noreply@orthosense.com>",
+            "to": ["a@example.com"],
+            "subject": "Hi",
+            "html": "<p>Zażółć</p>",
+        }
+
+    def test_static_request_parts_are_cached(self) -> None:
+        """Auth header and sender string are built once per settings value."""
+        assert _auth_headers("re_key") is _auth_headers("re_key")
+        assert _auth_headers("re_key") == {"Authorization": "Bearer re_key"}
+        assert _from_field("OrthoSense", "a@b.com") is _from_field(
+            "OrthoSense", "a@b.com"
+        )
+        assert _from_field("OrthoSense", "a@b.com") == "OrthoSense <a@b.com>"
+
+    @pytest.mark.asyncio
+    async def test_send_email_accepted_counts_as_success(self) -> None:
+        """Any 2xx response, not just 200, is treated as sent."""
+        with patch("app.services.email.settings") as mock_settings:
+            mock_settings.email_enabled = True
+            mock_settings.resend_api_key = "re_test_api_key"
+            mock_settings.resend_from_name = "OrthoSense"
+            mock_settings.resend_from_email = "noreply@orthosense.com"
+
+            response = httpx.Response(202, json={"id": "msg_202"})
+            with patch("app.services.email.get_http_client") as mock_get_client:
+                mock_client = AsyncMock()
+                mock_client.post.return_value = response
+                mock_get_client.return_value = mock_client
+
+                result = await _send_email("a@example.com", "Hi", "<p>Hi</p>")
+
+        assert result is True
+
     @pytest.mark.asyncio
     async def test_send_email_api_error(self) -> None:
         """API error returns False."""
@@ -110,14 +176,13 @@ class TestSendEmailInternal:
 
             mock_response = MagicMock()
             mock_response.status_code = 400
+            mock_response.is_success = False
             mock_response.text = "Bad Request"
 
-            with patch("httpx.AsyncClient") as mock_client_class:
+            with patch("app.services.email.get_http_client") as mock_get_client:
                 mock_client = AsyncMock()
                 mock_client.post.return_value = mock_response
-                mock_client.__aenter__.return_value = mock_client
-                mock_client.__aexit__.return_value = None
-                mock_client_class.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 result = await _send_email(
                     "recipient@example.com",
@@ -136,14 +201,12 @@ class TestSendEmailInternal:
             mock_settings.resend_from_name = "OrthoSense"
             mock_settings.resend_from_email = "noreply@orthosense.com"
 
-            with patch("httpx.AsyncClient") as mock_client_class:
+            with patch("app.services.email.get_http_client") as mock_get_client:
                 mock_client = AsyncMock()
                 mock_client.post.side_effect = httpx.TimeoutException(
                     "Connection timed out"
                 )
-                mock_client.__aenter__.return_value = mock_client
-                mock_client.__aexit__.return_value = None
-                mock_client_class.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 result = await _send_email(
                     "recipient@example.com",
@@ -162,12 +225,10 @@ class TestSendEmailInternal:
             mock_settings.resend_from_name = "OrthoSense"
             mock_settings.resend_from_email = "noreply@orthosense.com"
 
-            with patch("httpx.AsyncClient") as mock_client_class:
+            with patch("app.services.email.get_http_client") as mock_get_client:
                 mock_client = AsyncMock()
                 mock_client.post.side_effect = RuntimeError("Unexpected error")
-                mock_client.__aenter__.return_value = mock_client
-                mock_client.__aexit__.return_value = None
-                mock_client_class.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 result = await _send_email(
                     "recipient@example.com",
@@ -177,6 +238,96 @@ class TestSendEmailInternal:
 
                 assert result is False
 
+    @pytest.mark.asyncio
+    async def test_send_email_cancellation_propagates(self) -> None:
+        """CancelledError is not swallowed by the generic error handler."""
+        with patch("app.services.email.settings") as mock_settings:
+            mock_settings.email_enabled = True
+            mock_settings.resend_api_key = "re_test_api_key"
+            mock_settings.resend_from_name = "OrthoSense"
+            mock_settings.resend_from_email = "noreply@orthosense.com"
+
+            with patch("app.services.email.get_http_client") as mock_get_client:
+                mock_client = AsyncMock()
+                mock_client.post.side_effect = asyncio.CancelledError()
+                mock_get_client.return_value = mock_client
+
+                with pytest.raises(asyncio.CancelledError):
+                    await _send_email(
+                        "recipient@example.com",
+                        "Test Subject",
+                        "<p>Test body</p>",
+                    )
+
+
+class TestCheckEmailConfig:
+    """Tests for the startup email configuration check."""
+
+    @pytest.mark.parametrize(
+        ("enabled", "api_key", "expected"),
+        [(True, "re_key", True), (True, "", False), (False, "", True)],
+    )
+    def test_reports_missing_key_only_when_enabled(
+        self, enabled: bool, api_key: str, expected: bool
+    ) -> None:
+        """Only enabled-but-keyless configurations are flagged."""
+        with (
+            patch("app.services.email.settings") as mock_settings,
+            patch("app.services.email.logger") as mock_logger,
+        ):
+            mock_settings.email_enabled = enabled
+            mock_settings.resend_api_key = api_key
+
+            assert check_email_config() is expected
+
+        assert mock_logger.warning.called is not expected
+
+
+class TestSharedHttpClient:
+    """Tests for the pooled Resend HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_until_closed(self) -> None:
+        """The same client is returned until close_http_client is called."""
+        client = get_http_client()
+        assert get_http_client() is client
+
+        await close_http_client()
+        assert client.is_closed
+
+        new_client = get_http_client()
+        assert new_client is not client
+        await close_http_client()
+
+    def test_client_keeps_idle_connections_alive(self) -> None:
+        """Idle keep-alive outlives httpx's 5s default between sporadic sends."""
+        with (
+            patch("app.services.email._http_client", None),
+            patch("app.services.email.settings") as mock_settings,
+            patch("app.services.email.httpx.AsyncClient") as mock_client_cls,
+        ):
+            mock_settings.resend_pool_limit = 100
+            mock_settings.resend_max_keepalive_connections = 7
+            mock_settings.resend_keepalive_seconds = 60.0
+            get_http_client()
+
+        limits = mock_client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 7
+        assert limits.keepalive_expiry == 60.0
+
+    @pytest.mark.parametrize("available", [True, False])
+    def test_http2_follows_h2_availability(self, available: bool) -> None:
+        """HTTP/2 is enabled only when the h2 package is installed."""
+        with (
+            patch("app.services.email._http_client", None),
+            patch("app.services.email._HTTP2_AVAILABLE", available),
+            patch("app.services.email.httpx.AsyncClient") as mock_client_cls,
+        ):
+            get_http_client()
+
+        assert mock_client_cls.call_args.kwargs["http2"] is available
+
 
 class TestSendVerificationEmail:
     """Tests for send_verification_email function."""
@@ -61,8 +61,8 @@ class TestSendEmail:
             mock_settings.resend_from_name = "Test"
             mock_settings.resend_from_email = "test@test.com"
 
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            with patch("app.services.email.get_http_client") as mock_client:
+                mock_client.return_value.post = AsyncMock(
                     side_effect=httpx.TimeoutException("timeout")
                 )
 
@@ -205,14 +205,15 @@ class TestErrorHandling:
             mock_settings.resend_from_name = "Test"
             mock_settings.resend_from_email = "test@test.com"
 
-            with patch("httpx.AsyncClient") as mock_client:
+            with patch("app.services.email.get_http_client") as mock_client:
                 mock_response = AsyncMock()
                 mock_response.status_code = 500
+                mock_response.is_success = False
                 mock_response.text = "Internal Server Error"
 
                 mock_instance = AsyncMock()
                 mock_instance.post.return_value = mock_response
-                mock_client.return_value.__aenter__.return_value = mock_instance
+                mock_client.return_value = mock_instance
 
                 result = await _send_email(
                     to_email="test@example.com",
@@ -231,8 +232,8 @@ class TestErrorHandling:
             mock_settings.resend_from_name = "Test"
             mock_settings.resend_from_email = "test@test.com"
 
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            with patch("app.services.email.get_http_client") as mock_client:
+                mock_client.return_value.post = AsyncMock(
                     side_effect=Exception("Unknown error")
                 )
 
@@ -100,14 +100,15 @@ class TestSendEmailSuccess:
         """Returns true on successful send."""
         mock_response = MagicMock(spec=Response)
         mock_response.status_code = 200
+        mock_response.is_success = True
         mock_response.json.return_value = {"id": "test-id"}
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post.return_value = mock_response
+        mock_client.post.return_value = mock_response
 
         with (
             patch("app.services.email.settings") as mock_settings,
-            patch("app.services.email.httpx.AsyncClient", return_value=mock_client),
+            patch("app.services.email.get_http_client", return_value=mock_client),
         ):
             mock_settings.email_enabled = True
             mock_settings.resend_api_key = "test-key"
@@ -127,14 +128,15 @@ class TestSendEmailSuccess:
         """Logs success with message ID."""
         mock_response = MagicMock(spec=Response)
         mock_response.status_code = 200
+        mock_response.is_success = True
         mock_response.json.return_value = {"id": "msg-12345"}
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post.return_value = mock_response
+        mock_client.post.return_value = mock_response
 
         with (
             patch("app.services.email.settings") as mock_settings,
-            patch("app.services.email.httpx.AsyncClient", return_value=mock_client),
+            patch("app.services.email.get_http_client", return_value=mock_client),
             patch("app.services.email.logger") as mock_logger,
         ):
             mock_settings.email_enabled = True
@@ -159,14 +161,15 @@ class TestSendEmailFailure:
         """Returns false on API error response."""
         mock_response = MagicMock(spec=Response)
         mock_response.status_code = 400
+        mock_response.is_success = False
         mock_response.text = "Bad Request"
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post.return_value = mock_response
+        mock_client.post.return_value = mock_response
 
         with (
             patch("app.services.email.settings") as mock_settings,
-            patch("app.services.email.httpx.AsyncClient", return_value=mock_client),
+            patch("app.services.email.get_http_client", return_value=mock_client),
         ):
             mock_settings.email_enabled = True
             mock_settings.resend_api_key = "test-key"
@@ -191,13 +194,11 @@ class TestSendEmailTimeout:
         import httpx
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post.side_effect = httpx.TimeoutException(
-            "Timeout"
-        )
+        mock_client.post.side_effect = httpx.TimeoutException("Timeout")
 
         with (
             patch("app.services.email.settings") as mock_settings,
-            patch("app.services.email.httpx.AsyncClient", return_value=mock_client),
+            patch("app.services.email.get_http_client", return_value=mock_client),
         ):
             mock_settings.email_enabled = True
             mock_settings.resend_api_key = "test-key"
@@ -218,13 +219,11 @@ class TestSendEmailTimeout:
         import httpx
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post.side_effect = httpx.TimeoutException(
-            "Timeout"
-        )
+        mock_client.post.side_effect = httpx.TimeoutException("Timeout")
 
         with (
             patch("app.services.email.settings") as mock_settings,
-            patch("app.services.email.httpx.AsyncClient", return_value=mock_client),
+            patch("app.services.email.get_http_client", return_value=mock_client),
             patch("app.services.email.logger") as mock_logger,
         ):
             mock_settings.email_enabled = True
@@ -248,13 +247,11 @@ class TestSendEmailException:
     async def test_returns_false_on_exception(self) -> None:
         """Returns false on general exception."""
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post.side_effect = Exception(
-            "Network error"
-        )
+        mock_client.post.side_effect = Exception("Network error")
 
         with (
             patch("app.services.email.settings") as mock_settings,
-            patch("app.services.email.httpx.AsyncClient", return_value=mock_client),
+            patch("app.services.email.get_http_client", return_value=mock_client),
         ):
             mock_settings.email_enabled = True
             mock_settings.resend_api_key = "test-key"
@@ -13,6 +13,7 @@ from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -110,7 +111,7 @@ class TestExerciseCreation:
 class TestExerciseRetrieval:
     """Tests for exercise retrieval operations."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def sample_exercises(self, session: AsyncSession) -> list[Exercise]:
         """Create sample exercises for testing."""
         exercises = [
@@ -10,6 +10,7 @@ Test coverage:
 """
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -87,7 +88,7 @@ class TestProtocolBasicOperations:
 class TestProtocolProgressionLogic:
     """Tests for protocol progression business logic."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def progression_exercises(
         self,
         session: AsyncSession,
@@ -178,7 +179,7 @@ class TestProtocolProgressionLogic:
 class TestProtocolCategoryGrouping:
     """Tests for grouping exercises by category (protocol structure)."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def mixed_exercises(self, session: AsyncSession) -> list[Exercise]:
         """Create exercises with mixed categories."""
         exercises = [
@@ -251,7 +252,7 @@ class TestProtocolCategoryGrouping:
 class TestProtocolPatientAssignment:
     """Tests for protocol-patient assignment logic."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def therapist_user(self, session: AsyncSession) -> User:
         """Create a therapist/admin user."""
         user = User(
@@ -265,7 +266,7 @@ class TestProtocolPatientAssignment:
         await session.refresh(user)
         return user
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def patient_user(self, session: AsyncSession) -> User:
         """Create a patient user."""
         user = User(
@@ -307,7 +308,7 @@ class TestProtocolPatientAssignment:
 class TestProtocolDurationCalculation:
     """Tests for protocol duration and timing calculations."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def timed_exercises(self, session: AsyncSession) -> list[Exercise]:
         """Create exercises with duration information."""
         exercises = [
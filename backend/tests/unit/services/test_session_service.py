@@ -14,6 +14,7 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.exercise import BodyPart, Exercise, ExerciseCategory
@@ -188,7 +189,7 @@ class TestSessionLifecycle:
 class TestExerciseResults:
     """Tests for exercise result recording within sessions."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def test_exercise(self, session: AsyncSession) -> Exercise:
         """Create a test exercise."""
         exercise = Exercise(
@@ -205,7 +206,7 @@ class TestExerciseResults:
         await session.commit()
         return exercise
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def active_session(
         self,
         session: AsyncSession,
@@ -198,6 +198,25 @@ class TestSanitizeDict:
         result = sanitize_dict(data)
         assert result == data
 
+    def test_deeply_nested_structure_and_key_order(self) -> None:
+        """Deep nesting is handled without recursion and keeps key order."""
+        leaf: dict = {"name": "<b>x</b>"}
+        data: dict = leaf
+        for depth in range(2000):
+            data = {"level": depth, "child": data}
+        result = sanitize_dict(data)
+        assert list(result) == ["level", "child"]
+        node = result
+        while "child" in node:
+            node = node["child"]
+        assert node["name"] == "&lt;b&gt;x&lt;/b&gt;"
+
+    def test_does_not_mutate_input(self) -> None:
+        """Input dictionary is left untouched."""
+        data = {"items": [{"name": "<i>"}], "nested": {"tag": "<u>"}}
+        sanitize_dict(data)
+        assert data == {"items": [{"name": "<i>"}], "nested": {"tag": "<u>"}}
+
 
 class TestXSSEdgeCases:
     """Edge cases and bypass attempts."""